@@ -64,6 +64,24 @@ class GeneratedContent:
     model: str
 
 
+@dataclass(frozen=True)
+class AssetPick:
+    """
+    One asset choice plus where it came from.
+
+    Attributes
+    ----------
+    path : Path
+        The chosen file.
+    from_model : bool
+        ``True`` when an AI backend made the choice; ``False`` for the
+        heuristic / theme-preset fallbacks, which callers should not
+        cache as if the model had answered.
+    """
+    path: Path
+    from_model: bool
+
+
 # ------------------------------------------------------------------ #
 #  GeminiEngine                                                        #
 # ------------------------------------------------------------------ #
@@ -298,6 +316,17 @@ Write as if the person reading it is alone at 1:37 AM.
         mood: str,
         image_paths: list[Path],
     ) -> Path:
+        """
+        Path-only form of :meth:`pick_image`.
+        """
+        return self.pick_image(quote, mood, image_paths).path
+
+    def pick_image(
+        self,
+        quote: str,
+        mood: str,
+        image_paths: list[Path],
+    ) -> AssetPick:
         """
         Use Gemini Vision to pick the background image that best suits the
         quote and mood.  Falls back to heuristic filename scoring.
@@ -313,14 +342,14 @@ Write as if the person reading it is alone at 1:37 AM.
 
         Returns
         -------
-        Path
-            The best-matching image path.
+        AssetPick
+            The best-matching image path, and whether Gemini chose it.
         """
         if not image_paths:
             raise ValueError("No image paths provided")
 
         if len(image_paths) == 1:
-            return image_paths[0]
+            return AssetPick(image_paths[0], from_model=False)
 
         # Try Gemini Vision
         if self.gemini_api_key:
@@ -328,14 +357,14 @@ Write as if the person reading it is alone at 1:37 AM.
                 result = self._gemini_pick_image(quote, mood, image_paths)
                 if result:
                     logger.info("pick_best_image: Gemini selected '%s'", result.name)
-                    return result
+                    return AssetPick(result, from_model=True)
             except Exception as exc:
                 logger.warning("pick_best_image: Gemini Vision failed: %s — using heuristic", exc)
 
         # Heuristic fallback: score by filename keyword overlap with mood words
         result = self._heuristic_pick(image_paths, mood + " " + quote)
         logger.info("pick_best_image: fallback heuristic selected '%s'", result.name)
-        return result
+        return AssetPick(result, from_model=False)
 
     def pick_best_font(
         self,
@@ -344,6 +373,18 @@ Write as if the person reading it is alone at 1:37 AM.
         font_paths: list[Path],
         theme_font: Optional[Path] = None,
     ) -> Path:
+        """
+        Path-only form of :meth:`pick_font`.
+        """
+        return self.pick_font(quote, mood, font_paths, theme_font=theme_font).path
+
+    def pick_font(
+        self,
+        quote: str,
+        mood: str,
+        font_paths: list[Path],
+        theme_font: Optional[Path] = None,
+    ) -> AssetPick:
         """
         Ask Gemini which font name from the available list best suits the
         quote text and mood.  Falls back to the theme-preset font.
@@ -361,26 +402,26 @@ Write as if the person reading it is alone at 1:37 AM.
 
         Returns
         -------
-        Path
-            Best-matching font path.
+        AssetPick
+            Best-matching font path, and whether the model chose it.
         """
         if not font_paths:
-            return theme_font or _FALLBACK_FONT
+            return AssetPick(theme_font or _FALLBACK_FONT, from_model=False)
 
         if theme_font and len(font_paths) <= 3:
             # Theme already made a fine choice when options are limited
-            return theme_font
+            return AssetPick(theme_font, from_model=False)
 
         if self.gemini_api_key:
             try:
                 result = self._gemini_pick_font(quote, mood, font_paths)
                 if result:
                     logger.info("pick_best_font: Gemini selected '%s'", result.name)
-                    return result
+                    return AssetPick(result, from_model=True)
             except Exception as exc:
                 logger.warning("pick_best_font: Gemini failed: %s — using theme font", exc)
 
-        return theme_font or font_paths[0]
+        return AssetPick(theme_font or font_paths[0], from_model=False)
 
     def pick_best_music(
         self,
@@ -388,6 +429,17 @@ Write as if the person reading it is alone at 1:37 AM.
         music_paths: list[Path],
         theme_music: Optional[Path] = None,
     ) -> Path:
+        """
+        Path-only form of :meth:`pick_music`.
+        """
+        return self.pick_music(mood, music_paths, theme_music=theme_music).path
+
+    def pick_music(
+        self,
+        mood: str,
+        music_paths: list[Path],
+        theme_music: Optional[Path] = None,
+    ) -> AssetPick:
         """
         Ask Gemini which music track (by filename) best matches the mood.
 
@@ -402,22 +454,22 @@ Write as if the person reading it is alone at 1:37 AM.
 
         Returns
         -------
-        Path
-            Best-matching music path.
+        AssetPick
+            Best-matching music path, and whether the model chose it.
         """
         if not music_paths:
-            return theme_music
+            return AssetPick(theme_music, from_model=False)
 
         if self.gemini_api_key:
             try:
                 result = self._gemini_pick_music(mood, music_paths)
                 if result:
                     logger.info("pick_best_music: Gemini selected '%s'", result.name)
-                    return result
+                    return AssetPick(result, from_model=True)
             except Exception as exc:
                 logger.warning("pick_best_music: Gemini failed: %s — using theme music", exc)
 
-        return theme_music or music_paths[0]
+        return AssetPick(theme_music or music_paths[0], from_model=False)
 
     def validate_frame(self, frame_path: Path, quote: str) -> dict:
         """
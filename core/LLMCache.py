@@ -0,0 +1,128 @@
+"""
+core/LLMCache.py
+────────────────
+Small on-disk cache for AI engine answers.
+
+Asset picks and peer-review rewrites are fully determined by their
+inputs (quote, mood, candidate filenames …) from the pipeline's point of
+view, yet each one costs a multi-second Gemini / HuggingFace round-trip.
+This module stores their answers in a local SQLite file keyed by a hash
+of those inputs, so repeated runs skip the network entirely.
+
+Values must be JSON-serialisable.  Entries expire after *ttl_sec*;
+expired rows are deleted whenever a cache is opened.
+
+Usage:
+    cache = LLMCache(ROOT / ".cache" / "llm")
+    key = LLMCache.make_key("pick_best_music", mood, sorted(names))
+    hit = cache.get(key)
+    if hit is None:
+        hit = engine.pick_best_music(...).name
+        cache.set(key, hit)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_DB_NAME = "llm_cache.sqlite3"
+_DEFAULT_TTL_SEC = 7 * 86400   # one week
+
+
+class LLMCache:
+    """
+    Persistent key → JSON value store backed by SQLite.
+
+    Safe to share between threads; every operation holds an internal lock.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory holding the cache database (created if missing).
+    ttl_sec : int
+        Lifetime of an entry in seconds (default: one week).
+    """
+
+    def __init__(self, cache_dir: Path, ttl_sec: int = _DEFAULT_TTL_SEC) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / _DB_NAME), check_same_thread=False
+        )
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires REAL NOT NULL)"
+            )
+            # Expired rows are never read again; drop them so the file
+            # doesn't grow across runs
+            purged = self._conn.execute(
+                "DELETE FROM entries WHERE expires < ?", (time.time(),)
+            ).rowcount
+        if purged:
+            logger.debug("LLMCache: purged %d expired entries", purged)
+        logger.debug("LLMCache ready (%s)", self.cache_dir / _DB_NAME)
+
+    # ------------------------------------------------------------------ #
+    #  Public API                                                          #
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Hash *parts* into a cache key.
+
+        Parameters
+        ----------
+        *parts : Any
+            JSON-serialisable inputs that fully determine the answer
+            (method name first, by convention).
+
+        Returns
+        -------
+        str
+            Hex BLAKE2b digest.
+        """
+        raw = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for *key*, or ``None`` if absent or expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store *value* under *key*, replacing any previous entry.
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+                (key, payload, time.time() + self.ttl_sec),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -13,8 +13,11 @@ prompt-engineering best-practices for short-form vertical video.
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
@@ -22,6 +25,11 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# health_check results per base_url: (monotonic stamp, ok)
+_HEALTH_TTL_SEC = 60.0
+_health_cache: dict[str, tuple[float, bool]] = {}
+_health_lock = threading.Lock()
+
 
 # ------------------------------------------------------------------ #
 #  Data models                                                         #
@@ -112,6 +120,11 @@ class LLMEngine:
         """
         Generate quote, title, and caption for the given theme in one call.
 
+        Tries :meth:`generate_all_batched` (one JSON-mode request) first.
+        If the model's JSON is unusable, falls back to per-field prompts:
+        the quote first, then title and caption concurrently (Ollama
+        decodes them in parallel when ``OLLAMA_NUM_PARALLEL`` ≥ 2).
+
         Parameters
         ----------
         theme_name : str
@@ -131,19 +144,88 @@ class LLMEngine:
         """
         logger.info("LLMEngine: generating content for theme=%r mood=%r", theme_name, mood)
 
-        quote = self.generate_quote(theme_name, mood)
-        title = self.generate_title(theme_name, quote)
-        caption = self.generate_caption(theme_name, quote, title)
+        try:
+            content = self.generate_all_batched(theme_name, mood)
+        except ValueError as exc:
+            logger.warning(
+                "LLMEngine: batched JSON generation unusable (%s) — "
+                "falling back to per-field prompts.",
+                exc,
+            )
+            quote = self.generate_quote(theme_name, mood)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                title_future = pool.submit(self.generate_title, theme_name, quote)
+                caption_future = pool.submit(self.generate_caption, theme_name, quote)
+                title = title_future.result()
+                caption = caption_future.result()
+
+            content = GeneratedContent(
+                quote=quote,
+                title=title,
+                caption=caption,
+                theme_name=theme_name,
+                model=self.model,
+            )
+        logger.info("LLMEngine: content generation complete.")
+        return content
+
+    def generate_all_batched(self, theme_name: str, mood: str) -> GeneratedContent:
+        """
+        Generate quote, title, and caption with a single JSON-mode request.
+
+        One prompt and one prefill instead of three round-trips; Ollama's
+        ``format="json"`` constrains the reply to valid JSON.
+
+        Parameters
+        ----------
+        theme_name : str
+            Human-readable theme display name.
+        mood : str
+            Mood descriptor from the selected ``Theme`` object.
+
+        Returns
+        -------
+        GeneratedContent
+            Fully populated content object.
 
-        content = GeneratedContent(
-            quote=quote,
-            title=title,
-            caption=caption,
+        Raises
+        ------
+        ValueError
+            If the reply is not a JSON object with non-empty ``quote``,
+            ``title`` and ``caption`` strings.
+        RuntimeError
+            If the request fails after all retries.
+        """
+        prompt = (
+            f"You write content for dark aesthetic Gen Z short-form videos. "
+            f"The theme is '{theme_name}' and the mood is '{mood}'.\n\n"
+            "Return ONLY a JSON object with exactly these string fields:\n"
+            '- "quote": ONE dark, poetic, introspective quote, 1 to 2 sentences, '
+            "natural Gen Z voice, no quotation marks, hashtags, or emojis\n"
+            '- "title": a punchy video title under 60 characters that sparks '
+            "curiosity, no hashtags or emojis\n"
+            '- "caption": an Instagram / YouTube Shorts caption — one hook line, '
+            "2–3 lines of body copy deepening the mood, 1–3 emojis at most, and "
+            "up to 15 relevant hashtags on a final new line\n"
+        )
+        raw = self._generate(prompt, label="content_json", json_mode=True)
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON from model: {exc}") from exc
+
+        fields: dict[str, str] = {}
+        for key in ("quote", "title", "caption"):
+            value = data.get(key) if isinstance(data, dict) else None
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"missing or empty {key!r} in model JSON")
+            fields[key] = value.strip()
+
+        return GeneratedContent(
+            **fields,
             theme_name=theme_name,
             model=self.model,
         )
-        logger.info("LLMEngine: content generation complete.")
-        return content
 
     def generate_quote(self, theme_name: str, mood: str) -> str:
         """
@@ -205,7 +287,7 @@ class LLMEngine:
         return self._generate(prompt, label="title")
 
     def generate_caption(
-        self, theme_name: str, quote: str, title: str
+        self, theme_name: str, quote: str, title: Optional[str] = None
     ) -> str:
         """
         Generate a social-media caption with hashtag block.
@@ -216,8 +298,9 @@ class LLMEngine:
             Theme display name.
         quote : str
             The generated quote text.
-        title : str
-            The generated video title.
+        title : str | None
+            The generated video title, if already known (omitted when the
+            caption is generated alongside the title).
 
         Returns
         -------
@@ -227,8 +310,8 @@ class LLMEngine:
         prompt = (
             f"You are a social-media copywriter who specialises in Gen Z short-form content.\n\n"
             f"Theme: {theme_name}\n"
-            f"Title: {title}\n"
-            f"Quote: {quote}\n\n"
+            + (f"Title: {title}\n" if title else "")
+            + f"Quote: {quote}\n\n"
             "Write an Instagram / YouTube Shorts CAPTION that:\n"
             "- Opens with one engaging hook line (no emojis yet)\n"
             "- Has 2–3 lines of body copy that deepen the mood\n"
@@ -243,7 +326,9 @@ class LLMEngine:
     #  Core HTTP layer                                                     #
     # ------------------------------------------------------------------ #
 
-    def _generate(self, prompt: str, label: str = "content") -> str:
+    def _generate(
+        self, prompt: str, label: str = "content", json_mode: bool = False
+    ) -> str:
         """
         Send a generation request to Ollama and return the response text.
 
@@ -253,6 +338,9 @@ class LLMEngine:
             Full prompt string to send to the model.
         label : str
             Human-readable label used only in log messages.
+        json_mode : bool
+            Ask Ollama for a JSON reply (``format="json"``) and allow a
+            longer output for the combined fields.
 
         Returns
         -------
@@ -271,9 +359,11 @@ class LLMEngine:
             "stream": False,
             "options": {
                 "temperature": self.temperature,
-                "num_predict": 256,
+                "num_predict": 512 if json_mode else 256,
             },
         }
+        if json_mode:
+            payload["format"] = "json"
 
         last_error: Optional[Exception] = None
 
@@ -302,6 +392,7 @@ class LLMEngine:
                 return text
 
             except requests.exceptions.ConnectionError as exc:
+                self._invalidate_health()
                 logger.error(
                     "Ollama connection error (attempt %d/%d): %s — "
                     "is 'ollama serve' running?",
@@ -321,6 +412,8 @@ class LLMEngine:
                 last_error = exc
 
             except requests.exceptions.HTTPError as exc:
+                if exc.response is not None and exc.response.status_code >= 500:
+                    self._invalidate_health()
                 logger.error(
                     "Ollama HTTP error %s (attempt %d/%d): %s",
                     exc.response.status_code if exc.response else "?",
@@ -344,15 +437,32 @@ class LLMEngine:
             f"{self.max_retries} attempts. Last error: {last_error}"
         )
 
-    def health_check(self) -> bool:
+    def health_check(self, max_age: float = _HEALTH_TTL_SEC) -> bool:
         """
         Ping the Ollama server to verify it is reachable.
 
+        The result is shared per ``base_url`` for *max_age* seconds, so
+        back-to-back runs in one process skip the probe.  A connection
+        error or 5xx from :meth:`_generate` drops the cached result.
+
+        Parameters
+        ----------
+        max_age : float
+            Reuse a previous result younger than this many seconds
+            (``0`` forces a fresh probe).
+
         Returns
         -------
         bool
             ``True`` if the server responds with HTTP 200, ``False`` otherwise.
         """
+        now = time.monotonic()
+        with _health_lock:
+            cached = _health_cache.get(self.base_url)
+        if cached is not None and now - cached[0] < max_age:
+            logger.debug("Ollama health check: cached %s", cached[1])
+            return cached[1]
+
         try:
             resp = self._session.get(self.base_url, timeout=5)
             ok = resp.status_code == 200
@@ -362,7 +472,15 @@ class LLMEngine:
                 logger.warning(
                     "Ollama health check returned HTTP %d", resp.status_code
                 )
-            return ok
         except requests.exceptions.RequestException as exc:
             logger.error("Ollama health check failed: %s", exc)
-            return False
+            ok = False
+
+        with _health_lock:
+            _health_cache[self.base_url] = (now, ok)
+        return ok
+
+    def _invalidate_health(self) -> None:
+        """Forget the cached health_check result for this server."""
+        with _health_lock:
+            _health_cache.pop(self.base_url, None)
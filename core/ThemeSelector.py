@@ -13,7 +13,10 @@ track from the local asset directories.
 from __future__ import annotations
 
 import logging
+import os
 import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -21,6 +24,12 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def _suffix(name: bytes) -> bytes:
+    """Return the lowercased extension of *name* without its dot (like ``Path.suffix``)."""
+    stem, dot, ext = name.rpartition(b".")
+    return ext.lower() if stem and dot else b""
+
+
 # ------------------------------------------------------------------ #
 #  Data model                                                          #
 # ------------------------------------------------------------------ #
@@ -165,6 +174,9 @@ class ThemeSelector:
         ),
     )
 
+    # Upper bound on memoised trend sets before the cache is reset
+    _WEIGHTS_CACHE_SIZE: int = 64
+
     # Supported media file extensions
     IMAGE_EXTENSIONS: frozenset[str] = frozenset(
         {".jpg", ".jpeg", ".png", ".webp", ".bmp"}
@@ -185,6 +197,16 @@ class ThemeSelector:
         self.trend_boost_factor = trend_boost_factor
         self._rng = random.Random(seed)
 
+        # Memoised theme weights keyed by (trend set, boost factor)
+        self._weights_cache: dict[tuple[frozenset[str], float], array] = {}
+        self._base_weights = array("d", (t.base_weight for t in self.THEMES))
+
+        # Music keywords pre-encoded once so scoring runs as bytes-in-bytes
+        self._music_kw_bytes: dict[str, tuple[bytes, ...]] = {
+            theme.name: tuple(os.fsencode(kw) for kw in theme.music_keywords)
+            for theme in self.THEMES
+        }
+
         self._validate_dirs()
         logger.debug(
             "ThemeSelector ready (backgrounds=%s, music=%s)",
@@ -214,9 +236,23 @@ class ThemeSelector:
             Resolved theme + file paths.
         """
         theme = self._pick_theme(trending_topics or [])
-        background = self._pick_asset(self.backgrounds_dir, self.IMAGE_EXTENSIONS)
-        music = self._pick_music(theme)
-        font = self._resolve_font(theme)
+
+        # The three directory walks are independent I/O, so overlap them.
+        # Random picks stay on this thread to keep seeded runs reproducible.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            bg_scan = pool.submit(
+                self._scan_files, self.backgrounds_dir, self.IMAGE_EXTENSIONS
+            )
+            music_scan = pool.submit(
+                self._scan_files, self.music_dir, self.AUDIO_EXTENSIONS
+            )
+            font_lookup = pool.submit(self._resolve_font, theme)
+
+            background = self._pick_asset(
+                self.backgrounds_dir, self.IMAGE_EXTENSIONS, bg_scan.result()
+            )
+            music = self._pick_music(theme, music_scan.result())
+            font = font_lookup.result()
 
         assets = SelectedAssets(
             theme=theme,
@@ -253,23 +289,56 @@ class ThemeSelector:
         Theme
             The selected theme.
         """
-        normalised_trends = {t.lower() for t in trending_topics}
-        weights: list[float] = []
-
-        for theme in self.THEMES:
-            if normalised_trends.intersection(theme.keywords):
-                weights.append(theme.base_weight * self.trend_boost_factor)
-                logger.debug(
-                    "Boosting theme=%r (trending overlap found)", theme.name
-                )
-            else:
-                weights.append(theme.base_weight)
+        normalised_trends = frozenset(t.lower() for t in trending_topics)
+        weights = self._theme_weights(normalised_trends)
 
         (chosen,) = self._rng.choices(self.THEMES, weights=weights, k=1)
         return chosen
 
+    def _theme_weights(self, normalised_trends: frozenset[str]) -> array:
+        """
+        Return the per-theme sampling weights for *normalised_trends*.
+
+        The keyword-overlap scan is pure, so results are memoised per
+        unique trend set (and boost factor); only the random roll in
+        :meth:`_pick_theme` varies between calls.
+
+        Parameters
+        ----------
+        normalised_trends : frozenset[str]
+            Lowercased trending keyword strings.
+
+        Returns
+        -------
+        array
+            Contiguous ``array('d')`` of weights aligned with :attr:`THEMES`.
+        """
+        key = (normalised_trends, self.trend_boost_factor)
+        cached = self._weights_cache.get(key)
+        if cached is not None:
+            return cached
+
+        weights = array("d", self._base_weights)
+        boosted: list[str] = []
+
+        for i, theme in enumerate(self.THEMES):
+            if normalised_trends.intersection(theme.keywords):
+                weights[i] *= self.trend_boost_factor
+                boosted.append(theme.name)
+
+        if boosted and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Boosted themes (trending overlap found): %s", boosted)
+
+        if len(self._weights_cache) >= self._WEIGHTS_CACHE_SIZE:
+            self._weights_cache.clear()
+        self._weights_cache[key] = weights
+        return weights
+
     def _pick_asset(
-        self, directory: Path, extensions: frozenset[str]
+        self,
+        directory: Path,
+        extensions: frozenset[str],
+        candidates: Optional[list[os.DirEntry[bytes]]] = None,
     ) -> Optional[Path]:
         """
         Randomly pick one file from *directory* with an extension in
@@ -281,17 +350,16 @@ class ThemeSelector:
             Directory to search.
         extensions : frozenset[str]
             Allowed file extensions (lowercase, including leading dot).
+        candidates : list[os.DirEntry[bytes]] | None
+            Pre-scanned entries; *directory* is scanned when ``None``.
 
         Returns
         -------
         Path | None
             A random matching file, or ``None`` if none are found.
         """
-        candidates = [
-            f
-            for f in directory.iterdir()
-            if f.is_file() and f.suffix.lower() in extensions
-        ]
+        if candidates is None:
+            candidates = self._scan_files(directory, extensions)
 
         if not candidates:
             logger.warning(
@@ -301,9 +369,16 @@ class ThemeSelector:
             )
             return None
 
-        return self._rng.choice(candidates)
+        if len(candidates) == 1:
+            return self._to_path(candidates[0])
+
+        return self._to_path(self._rng.choice(candidates))
 
-    def _pick_music(self, theme: Theme) -> Optional[Path]:
+    def _pick_music(
+        self,
+        theme: Theme,
+        candidates: Optional[list[os.DirEntry[bytes]]] = None,
+    ) -> Optional[Path]:
         """
         Pick the most mood-appropriate music file for *theme*.
 
@@ -316,17 +391,16 @@ class ThemeSelector:
         ----------
         theme : Theme
             The selected theme with ``music_keywords``.
+        candidates : list[os.DirEntry[bytes]] | None
+            Pre-scanned audio entries; ``music_dir`` is scanned when ``None``.
 
         Returns
         -------
         Path | None
             Path to the best-matching audio file.
         """
-        candidates = [
-            f
-            for f in self.music_dir.iterdir()
-            if f.is_file() and f.suffix.lower() in self.AUDIO_EXTENSIONS
-        ]
+        if candidates is None:
+            candidates = self._scan_files(self.music_dir, self.AUDIO_EXTENSIONS)
 
         if not candidates:
             logger.warning(
@@ -334,32 +408,77 @@ class ThemeSelector:
             )
             return None
 
+        # Nothing to rank when the library holds a single track
+        if len(candidates) == 1:
+            return self._to_path(candidates[0])
+
         if not theme.music_keywords:
-            return self._rng.choice(candidates)
+            return self._to_path(self._rng.choice(candidates))
 
         # Score each file by keyword matches in filename
-        scored: list[tuple[int, Path]] = []
-        for f in candidates:
-            name_lower = f.stem.lower()
-            score = sum(1 for kw in theme.music_keywords if kw in name_lower)
-            scored.append((score, f))
+        keywords = self._music_kw_bytes.get(theme.name) or tuple(
+            os.fsencode(kw) for kw in theme.music_keywords
+        )
+        scored: list[tuple[int, os.DirEntry[bytes]]] = []
+        for entry in candidates:
+            name_lower = entry.name.rpartition(b".")[0].lower()
+            score = sum(1 for kw in keywords if kw in name_lower)
+            scored.append((score, entry))
 
         max_score = max(s for s, _ in scored)
         if max_score == 0:
             # No keyword matches — fall back to random
-            chosen = self._rng.choice(candidates)
-            logger.debug("No music keyword match for theme=%r — random pick: %s", theme.name, chosen.name)
+            chosen = self._to_path(self._rng.choice(candidates))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No music keyword match for theme=%r — random pick: %s", theme.name, chosen.name)
             return chosen
 
         # Pick randomly among the top-scoring files
-        best = [f for s, f in scored if s == max_score]
-        chosen = self._rng.choice(best)
+        best = [e for s, e in scored if s == max_score]
+        chosen = self._to_path(self._rng.choice(best))
         logger.info(
             "Music matched for theme=%r (score=%d/%d): %s",
             theme.name, max_score, len(theme.music_keywords), chosen.name,
         )
         return chosen
 
+    @staticmethod
+    def _scan_files(
+        directory: Path, extensions: frozenset[str]
+    ) -> list[os.DirEntry[bytes]]:
+        """
+        List files directly inside *directory* whose extension is in
+        *extensions*, without building a ``Path`` per entry.
+
+        Entries are scanned as bytes so non-matching names never go
+        through ``os.fsdecode``; callers wrap only the chosen entry via
+        :meth:`_to_path`.
+
+        Parameters
+        ----------
+        directory : Path
+            Directory to scan.
+        extensions : frozenset[str]
+            Allowed file extensions (lowercase, including leading dot).
+
+        Returns
+        -------
+        list[os.DirEntry[bytes]]
+            Matching directory entries (may be empty).
+        """
+        ext_bytes = {os.fsencode(ext.lstrip(".")) for ext in extensions}
+        with os.scandir(os.fsencode(directory)) as it:
+            return [
+                entry
+                for entry in it
+                if entry.is_file() and _suffix(entry.name) in ext_bytes
+            ]
+
+    @staticmethod
+    def _to_path(entry: os.DirEntry[bytes]) -> Path:
+        """Decode a bytes directory entry back into a ``Path``."""
+        return Path(os.fsdecode(entry.path))
+
     def _resolve_font(self, theme: Theme) -> Optional[Path]:
         """
         Resolve the theme's preferred font file to an absolute path.
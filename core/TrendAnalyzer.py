@@ -11,6 +11,7 @@ from __future__ import annotations
 import time
 import random
 import logging
+import threading
 from typing import Optional
 
 from pytrends.request import TrendReq
@@ -35,7 +36,7 @@ class TrendAnalyzer:
     retry_delay : float
         Seconds to wait between retries (uses simple exponential back-off).
     _pytrends : TrendReq
-        Underlying pytrends session object.
+        Underlying pytrends session object for the calling thread.
     """
 
     # Topics we care about for short-form vertical content
@@ -52,6 +53,13 @@ class TrendAnalyzer:
         "vintage aesthetic",
     ]
 
+    # One TrendReq per (thread, locale), shared across analyzer instances.
+    # A TrendReq is stateful (build_payload stores the query on it), so
+    # giving each worker thread its own lets concurrent fetches run in
+    # parallel without a lock, while repeat fetches on a thread still
+    # reuse its client.
+    _local = threading.local()
+
     def __init__(
         self,
         geo: str = "US",
@@ -78,7 +86,6 @@ class TrendAnalyzer:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-        self._pytrends = TrendReq(hl=self.language, tz=360, timeout=(10, 25))
         logger.debug("TrendAnalyzer initialised (geo=%s, lang=%s)", geo, language)
 
     # ------------------------------------------------------------------ #
@@ -147,6 +154,25 @@ class TrendAnalyzer:
     #  Private helpers                                                     #
     # ------------------------------------------------------------------ #
 
+    @property
+    def _pytrends(self) -> TrendReq:
+        """
+        Return the calling thread's ``TrendReq`` for :attr:`language`,
+        creating it on first use.
+
+        ``TrendReq`` fetches a Google cookie on construction, so reusing one
+        client per thread and locale saves that round-trip per analyzer.
+        """
+        clients: Optional[dict[str, TrendReq]] = getattr(self._local, "clients", None)
+        if clients is None:
+            clients = self._local.clients = {}
+        client = clients.get(self.language)
+        if client is None:
+            client = clients[self.language] = TrendReq(
+                hl=self.language, tz=360, timeout=(10, 25)
+            )
+        return client
+
     def _fetch_batch(
         self, keywords: list[str], timeframe: str
     ) -> dict[str, float]:
@@ -167,10 +193,11 @@ class TrendAnalyzer:
         """
         for attempt in range(1, self.max_retries + 1):
             try:
-                self._pytrends.build_payload(
+                pytrends = self._pytrends
+                pytrends.build_payload(
                     keywords, cat=0, timeframe=timeframe, geo=self.geo, gprop=""
                 )
-                df = self._pytrends.interest_over_time()
+                df = pytrends.interest_over_time()
 
                 if df.empty:
                     logger.warning("Empty trend DataFrame for keywords: %s", keywords)
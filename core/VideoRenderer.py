@@ -17,15 +17,22 @@ Output: H.264 MP4 at 1080 × 1920, 30 fps, AAC audio, ~30 seconds.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import IO, Literal, Optional, Union
 
-from PIL import Image
+from PIL import Image, ImageOps
 
 from core.TextOverlay import TextOverlay
 
@@ -42,6 +49,270 @@ _AUDIO_CODEC = "aac"
 _AUDIO_BITRATE = "256k"
 _CRF = 18              # constant rate factor (lower = better quality, 18 ≈ visually lossless)
 _PRESET = "medium"     # FFmpeg preset (ultrafast → veryslow)
+_TUNE = "stillimage"   # x264 tune for a static background
+
+# libx264 (preset, crf) per render quality; previews trade size for speed
+_QUALITY_PRESETS: dict[str, tuple[str, int]] = {
+    "preview": ("ultrafast", 23),
+    "final": (_PRESET, _CRF),
+}
+_PIPE_BUFSIZE = 1 << 20  # 1 MiB FFmpeg pipe buffer
+_STDERR_TAIL = 500       # chars of FFmpeg stderr kept for error reports
+_BG_CACHE_SIZE = 8       # decoded backgrounds kept for repeated renders
+_PROGRESS_POLL_SEC = 1.0  # how often a running encode is checked for stalls
+
+# `-progress` keys whose change means the encode is still moving
+_PROGRESS_KEYS = frozenset({b"frame", b"out_time_us", b"out_time_ms"})
+
+# Hardware H.264 encoders in preference order, with flags roughly matching CRF 18
+_HW_ENCODERS: dict[str, tuple[str, ...]] = {
+    "h264_nvenc": ("-preset", "p5", "-rc", "vbr", "-cq", "19", "-b:v", "0"),
+    "h264_qsv": ("-preset", "medium", "-global_quality", "19"),
+    "h264_videotoolbox": ("-q:v", "55"),
+    "h264_amf": ("-quality", "quality", "-rc", "cqp", "-qp_i", "19", "-qp_p", "19"),
+    "h264_vaapi": ("-qp", "19"),
+}
+# Short names accepted by ``hw_accel=`` (and main.py's --hwaccel)
+_HW_ACCEL_NAMES: dict[str, str] = {
+    "nvenc": "h264_nvenc",
+    "qsv": "h264_qsv",
+    "videotoolbox": "h264_videotoolbox",
+    "amf": "h264_amf",
+    "vaapi": "h264_vaapi",
+}
+# VAAPI needs a render node and a hwupload filter, so it is never
+# auto-selected — only used when requested explicitly.
+_VAAPI_ENCODER = "h264_vaapi"
+_VAAPI_DEVICE = "/dev/dri/renderD128"
+
+
+def _drain_stderr(
+    stream: IO[bytes], tail: deque[str], last_progress: list[float]
+) -> None:
+    """
+    Consume *stream* until EOF, keeping only the last chars in *tail*.
+
+    ``-progress`` ``key=value`` lines are kept out of *tail*; whenever the
+    frame count or output time advances, ``last_progress[0]`` is set to
+    the current :func:`time.monotonic` value.
+    """
+    seen: dict[bytes, bytes] = {}
+    with stream:
+        for line in stream:
+            key, sep, value = line.rstrip().partition(b"=")
+            if sep and key and b" " not in key:
+                if key in _PROGRESS_KEYS and seen.get(key) != value:
+                    seen[key] = value
+                    last_progress[0] = time.monotonic()
+                continue
+            tail.extend(line.decode("utf-8", errors="replace"))
+
+
+def _feed_stdin(stream: IO[bytes], data: bytes) -> None:
+    """
+    Write *data* to FFmpeg's stdin and close it.
+
+    Runs on its own thread so a blocked write cannot keep the stall
+    watchdog in :meth:`VideoRenderer._exec_ffmpeg` from firing.
+    """
+    try:
+        with stream:
+            stream.write(data)
+    except OSError:
+        # FFmpeg exited early (EPIPE, or EINVAL on Windows); stderr explains why
+        pass
+
+
+@functools.lru_cache(maxsize=_BG_CACHE_SIZE)
+def _load_background(path: str, mtime_ns: int) -> Image.Image:
+    """
+    Decode a background image, memoized on path and modification time.
+
+    Batch renders frequently reuse the same background; the cached image
+    is only ever read (TextOverlay converts it into a new image).
+
+    Parameters
+    ----------
+    path : str
+        Background image path.
+    mtime_ns : int
+        ``st_mtime_ns`` of *path*; part of the key so edits invalidate it.
+
+    Returns
+    -------
+    Image.Image
+        Fully loaded image.
+    """
+    with Image.open(path) as img:
+        # Oversized JPEGs decode straight to ≥ canvas size via DCT
+        # scaling; a no-op for other formats and right-sized files.
+        img.draft("RGB", (_WIDTH, _HEIGHT))
+        img.load()
+        return img.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_ffmpeg(ffmpeg_path: str) -> str:
+    """
+    Confirm that FFmpeg is available on the system.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        Binary name or path as passed to :class:`VideoRenderer`.
+
+    Returns
+    -------
+    str
+        Absolute path of the resolved binary.
+
+    Raises
+    ------
+    EnvironmentError
+        If the FFmpeg binary cannot be found.
+    """
+    resolved = shutil.which(ffmpeg_path)
+    if resolved is None:
+        raise EnvironmentError(
+            f"FFmpeg not found at '{ffmpeg_path}'. "
+            "Install FFmpeg and ensure it is on your system PATH, "
+            "or pass the full path via ffmpeg_path= during construction."
+        )
+    logger.info("[VideoRenderer] FFmpeg found at: %s", resolved)
+    return resolved
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_hw_encoder(ffmpeg_path: str) -> Optional[str]:
+    """
+    Return the first hardware H.264 encoder that can actually encode.
+
+    Being listed by ``ffmpeg -encoders`` only means the encoder is compiled
+    in (stock Windows builds list nvenc, qsv and amf alike), so each listed
+    candidate must also pass a one-frame test encode.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        FFmpeg binary to probe.
+
+    Returns
+    -------
+    str | None
+        Encoder name (e.g. ``"h264_nvenc"``), or ``None`` when none is
+        usable or the probe fails (libx264 is used instead).
+    """
+    try:
+        proc = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("[VideoRenderer] Encoder probe failed: %s", exc)
+        return None
+
+    available = set((proc.stdout or "").split())
+    for name in _HW_ENCODERS:
+        if name != _VAAPI_ENCODER and name in available:
+            if _test_encode(ffmpeg_path, name):
+                logger.info("[VideoRenderer] Hardware encoder available: %s", name)
+                return name
+            logger.info(
+                "[VideoRenderer] %s is compiled in but unusable here; skipping", name
+            )
+    return None
+
+
+def _test_encode(ffmpeg_path: str, encoder: str) -> bool:
+    """
+    Encode one blank frame with *encoder*, discarding the output.
+
+    Returns
+    -------
+    bool
+        ``True`` if FFmpeg exits cleanly (the device and driver are present).
+    """
+    try:
+        proc = subprocess.run(
+            [
+                ffmpeg_path, "-hide_banner", "-v", "error",
+                "-f", "lavfi", "-i", "nullsrc=s=256x256",
+                "-frames:v", "1", "-pix_fmt", "nv12",
+                "-c:v", encoder, "-f", "null", "-",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("[VideoRenderer] Test encode with %s failed: %s", encoder, exc)
+        return False
+    if proc.returncode != 0:
+        logger.debug(
+            "[VideoRenderer] Test encode with %s exited %d: %s",
+            encoder, proc.returncode, (proc.stderr or "").strip()[-_STDERR_TAIL:],
+        )
+    return proc.returncode == 0
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_ffmpeg_major(ffmpeg_path: str) -> int:
+    """
+    Parse ``ffmpeg -version`` to extract the major version number.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        FFmpeg binary to probe.
+
+    Returns
+    -------
+    int
+        Major version (e.g. ``6`` for FFmpeg 6.1.1), or ``0`` when it
+        cannot be determined (legacy ``N-xxxxx`` builds included).
+    """
+    try:
+        proc = subprocess.run(
+            [ffmpeg_path, "-version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        first_line = (proc.stdout or proc.stderr or "").splitlines()[0]
+        m = re.search(r"version\s+n?(\d+)", first_line)
+        return int(m.group(1)) if m else 0
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("[VideoRenderer] Could not detect FFmpeg version: %s", exc)
+        return 0
+
+
+def warm_up(ffmpeg_path: str = "ffmpeg", hw_accel: Union[bool, str] = True) -> None:
+    """
+    Run the cached FFmpeg probes a :class:`VideoRenderer` needs.
+
+    Lets callers pay the ``which`` / ``-version`` / ``-encoders`` probes
+    and the hardware test encode in the background (e.g. while the LLM is
+    generating) so constructing the renderer later is instant.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        FFmpeg binary the renderer will use.
+    hw_accel : bool | str
+        Same meaning as the renderer argument; the encoder probe only
+        runs for ``True`` / ``"auto"``.
+
+    Raises
+    ------
+    EnvironmentError
+        If the FFmpeg binary cannot be found.
+    """
+    _resolve_ffmpeg(ffmpeg_path)
+    _probe_ffmpeg_major(ffmpeg_path)
+    if hw_accel is True or hw_accel == "auto":
+        _probe_hw_encoder(ffmpeg_path)
 
 
 # ------------------------------------------------------------------ #
@@ -67,6 +338,9 @@ class RenderResult:
         ``True`` if FFmpeg exited with code 0.
     error_message : str | None
         FFmpeg stderr (last 500 chars) if rendering failed.
+    overlay_frame_path : Path | None
+        Composited quote-card PNG in the system temp directory, when
+        requested via ``keep_frame``; the caller deletes it when done.
     """
 
     output_path: Path
@@ -75,6 +349,7 @@ class RenderResult:
     height: int
     success: bool
     error_message: Optional[str] = None
+    overlay_frame_path: Optional[Path] = None
 
 
 # ------------------------------------------------------------------ #
@@ -102,6 +377,18 @@ class VideoRenderer:
         created if ``None``.
     quote_font_path : Path | None
         Forwarded to the default ``TextOverlay`` if one is created.
+    hw_accel : bool | str
+        ``True`` / ``"auto"`` probes for a hardware H.264 encoder (NVENC /
+        QSV / VideoToolbox / AMF) and prefers it over libx264;
+        ``False`` / ``"none"`` always uses libx264; a short name
+        (``"nvenc"``, ``"qsv"``, ``"videotoolbox"``, ``"amf"``,
+        ``"vaapi"``) forces that encoder (default: ``True``).  A hardware
+        encode that fails falls back to libx264.
+    hw_device : str | None
+        VAAPI render node (default: ``/dev/dri/renderD128``).
+    x264_preset : str | None
+        libx264 preset for ``"final"`` renders, overriding ``"medium"``
+        (e.g. ``"veryfast"`` on slow CPUs).  Previews keep ``"ultrafast"``.
     """
 
     def __init__(
@@ -113,6 +400,9 @@ class VideoRenderer:
         fade_sec: float = _FADE_SEC,
         text_overlay: Optional[TextOverlay] = None,
         quote_font_path: Optional[Path] = None,
+        hw_accel: Union[bool, str] = True,
+        hw_device: Optional[str] = None,
+        x264_preset: Optional[str] = None,
     ) -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -127,7 +417,14 @@ class VideoRenderer:
             quote_font_path=quote_font_path,
         )
 
-        self._verify_ffmpeg()
+        # Probes are cached per binary, so repeated construction is free
+        _resolve_ffmpeg(self.ffmpeg_path)
+        self._hw_encoder = self._select_hw_encoder(hw_accel)
+        self._hw_device = hw_device or _VAAPI_DEVICE
+        self.x264_preset = x264_preset
+        self._ffmpeg_major = _probe_ffmpeg_major(self.ffmpeg_path)
+        # Encoder / filter-graph threads per render (split across batch workers)
+        self._threads = max(1, os.cpu_count() or 2)
         logger.debug(
             "VideoRenderer ready (output=%s, ffmpeg=%s, dur=%ds)",
             self.output_dir,
@@ -135,6 +432,29 @@ class VideoRenderer:
             self.duration_sec,
         )
 
+    def _select_hw_encoder(self, hw_accel: Union[bool, str]) -> Optional[str]:
+        """
+        Map the ``hw_accel`` constructor argument to an FFmpeg encoder name.
+
+        Raises
+        ------
+        ValueError
+            If *hw_accel* is an unknown short name.
+        """
+        if hw_accel is True or hw_accel == "auto":
+            return _probe_hw_encoder(self.ffmpeg_path)
+        if hw_accel is False or hw_accel == "none":
+            return None
+        try:
+            encoder = _HW_ACCEL_NAMES[hw_accel]
+        except KeyError:
+            raise ValueError(
+                f"Unknown hw_accel {hw_accel!r}; expected 'auto', 'none' or "
+                f"one of {sorted(_HW_ACCEL_NAMES)}."
+            ) from None
+        logger.info("[VideoRenderer] Hardware encoder requested: %s", encoder)
+        return encoder
+
     # ------------------------------------------------------------------ #
     #  Public API                                                          #
     # ------------------------------------------------------------------ #
@@ -146,6 +466,8 @@ class VideoRenderer:
         music_path: Path,
         quote: str,
         title: str,
+        quality: Literal["preview", "final"] = "final",
+        keep_frame: bool = False,
     ) -> RenderResult:
         """
         Render a complete 30-second vertical video.
@@ -166,42 +488,150 @@ class VideoRenderer:
             Quote text to render onto the video frame.
         title : str
             Not rendered on video in this phase (reserved for metadata).
+        quality : {"preview", "final"}
+            ``"preview"`` encodes with ``-preset ultrafast`` at CRF 23 for
+            quick iteration; ``"final"`` (default) uses the full-quality
+            settings.
+        keep_frame : bool
+            Also save the composited frame as a PNG in the system temp
+            directory (e.g. for vision validation); its path is returned in
+            :attr:`RenderResult.overlay_frame_path` and the caller is
+            responsible for deleting it.  Nothing is written to
+            ``output_dir``.
 
         Returns
         -------
         RenderResult
             Result object containing output path and success status.
         """
+        with tempfile.TemporaryDirectory() as tmp:
+            return self._render_job(
+                Path(tmp), self._threads, run_id, background_path, music_path,
+                quote, title, quality, keep_frame,
+            )
+
+    def render_many(
+        self,
+        jobs: list[dict],
+        max_workers: Optional[int] = None,
+    ) -> list[RenderResult]:
+        """
+        Render several independent videos concurrently.
+
+        Each job runs :meth:`render` on a worker thread; the heavy lifting
+        happens inside the FFmpeg child processes, so N workers keep N
+        encodes running in parallel.  All jobs share one scratch
+        directory, with intermediate files prefixed by run id.
+
+        Parameters
+        ----------
+        jobs : list[dict]
+            Keyword arguments for :meth:`render`, one dict per video.
+        max_workers : int | None
+            Concurrent renders (default: half the CPU count, at least 1).
+
+        Returns
+        -------
+        list[RenderResult]
+            Results in the same order as *jobs*.
+        """
+        if not jobs:
+            return []
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        max_workers = min(max_workers, len(jobs))
+
+        logger.info(
+            "[VideoRenderer] Batch rendering %d videos (%d workers)…",
+            len(jobs),
+            max_workers,
+        )
+        # Share the cores between workers instead of oversubscribing them
+        threads = max(1, self._threads // max_workers)
+        with tempfile.TemporaryDirectory() as tmp, \
+                ThreadPoolExecutor(max_workers=max_workers) as pool:
+            work_dir = Path(tmp)
+            return list(
+                pool.map(lambda job: self._render_job(work_dir, threads, **job), jobs)
+            )
+
+    # ------------------------------------------------------------------ #
+    #  Rendering                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _render_job(
+        self,
+        work_dir: Path,
+        threads: int,
+        run_id: str,
+        background_path: Path,
+        music_path: Path,
+        quote: str,
+        title: str,
+        quality: Literal["preview", "final"] = "final",
+        keep_frame: bool = False,
+    ) -> RenderResult:
+        """
+        Render one video using *work_dir* for intermediate files and
+        *threads* FFmpeg threads.
+
+        Per-call settings are passed down rather than stored on the
+        instance, so concurrent jobs on one renderer don't interfere.
+        See :meth:`render` for the remaining parameters.
+        """
+        if quality not in _QUALITY_PRESETS:
+            raise ValueError(
+                f"quality must be one of {sorted(_QUALITY_PRESETS)}, got {quality!r}"
+            )
         output_path = self.output_dir / f"{run_id}.mp4"
-        logger.info("[VideoRenderer] Rendering %s…", output_path.name)
+        logger.info("[VideoRenderer] Rendering %s (%s)…", output_path.name, quality)
 
         # ── Step 1: Composite quote card ─────────────────────────────── #
-        with tempfile.TemporaryDirectory() as tmp:
-            frame_path = Path(tmp) / "frame.png"
-            logger.debug("[VideoRenderer] Compositing quote card → %s", frame_path)
-
-            try:
-                bg_image = Image.open(str(background_path))
-                self._overlay.render(bg_image, quote, output_path=frame_path)
-            except Exception as exc:  # noqa: BLE001
-                msg = f"TextOverlay compositing failed: {exc}"
-                logger.error("[VideoRenderer] %s", msg)
-                return RenderResult(
-                    output_path=output_path,
-                    duration_sec=self.duration_sec,
-                    width=_WIDTH,
-                    height=_HEIGHT,
-                    success=False,
-                    error_message=msg,
-                )
+        logger.debug("[VideoRenderer] Compositing quote card…")
 
-            # ── Step 2: FFmpeg encode ────────────────────────────────── #
-            result = self._ffmpeg_encode(
-                frame_path=frame_path,
-                audio_path=music_path,
+        try:
+            background_path = Path(background_path)
+            bg_image = _load_background(
+                str(background_path), background_path.stat().st_mtime_ns
+            )
+            frame = self._overlay.render(bg_image, quote)
+            if frame.size != (_WIDTH, _HEIGHT):
+                # Safety net for custom overlays: letterbox to the canvas
+                # here so FFmpeg never has to scale/pad every frame.
+                frame = ImageOps.pad(
+                    frame.convert("RGB"), (_WIDTH, _HEIGHT), color=(0, 0, 0)
+                )
+            # Raw RGB24 goes straight to FFmpeg's stdin — no PNG
+            # compress / decompress round-trip.
+            frame_rgb = frame.convert("RGB").tobytes()
+            frame_path: Optional[Path] = None
+            if keep_frame:
+                fd, name = tempfile.mkstemp(prefix=f"{run_id}_", suffix=".png")
+                frame_path = Path(name)
+                with os.fdopen(fd, "wb") as fh:
+                    frame.save(fh, format="PNG", compress_level=1)
+        except Exception as exc:  # noqa: BLE001
+            msg = f"TextOverlay compositing failed: {exc}"
+            logger.error("[VideoRenderer] %s", msg)
+            return RenderResult(
                 output_path=output_path,
+                duration_sec=self.duration_sec,
+                width=_WIDTH,
+                height=_HEIGHT,
+                success=False,
+                error_message=msg,
             )
 
+        # ── Step 2: FFmpeg encode ────────────────────────────────────── #
+        result = self._ffmpeg_encode(
+            frame_rgb=frame_rgb,
+            work_dir=work_dir,
+            audio_path=music_path,
+            output_path=output_path,
+            quality=quality,
+            threads=threads,
+        )
+        result.overlay_frame_path = frame_path
         return result
 
     # ------------------------------------------------------------------ #
@@ -210,27 +640,39 @@ class VideoRenderer:
 
     def _ffmpeg_encode(
         self,
-        frame_path: Path,
+        frame_rgb: bytes,
+        work_dir: Path,
         audio_path: Path,
         output_path: Path,
+        quality: str = "final",
+        threads: int = 1,
     ) -> RenderResult:
         """
         Build and execute the FFmpeg command that combines still + audio.
 
         Filter graph:
-          • [0:v] loop the single image for *duration_sec* seconds
-          • apply fade-in / fade-out on video
+          • [0:v] fade-in / hold / fade-out segments of the still image,
+            stitched with the concat demuxer (see
+            :meth:`_encode_video_segments`)
           • [1:a] trim audio to *duration_sec*, apply afade in/out
-          • scale + pad to 1080 × 1920 (safety net for mismatched input)
+
+        The frame is already 1080 × 1920 (padded in Pillow by
+        :meth:`render`), so no per-frame scale/pad filters are needed.
 
         Parameters
         ----------
-        frame_path : Path
-            Composited frame PNG.
+        frame_rgb : bytes
+            Composited frame as packed 1080 × 1920 RGB24.
+        work_dir : Path
+            Scratch directory for the intermediate segments.
         audio_path : Path
             Music / audio file.
         output_path : Path
             Desired MP4 output path.
+        quality : str
+            Key into ``_QUALITY_PRESETS``.
+        threads : int
+            FFmpeg encoder / filter threads for this render.
 
         Returns
         -------
@@ -249,7 +691,7 @@ class VideoRenderer:
                 self.ffmpeg_path, "-i", str(audio_path), "-f", "null", "-"
             ]
             res = subprocess.run(probe_cmd, capture_output=True, text=True)
-            import re, random
+            import random
             m = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2}\.\d+)", res.stderr)
             if m:
                 h, m_mins, s = m.groups()
@@ -265,23 +707,46 @@ class VideoRenderer:
         except Exception as exc:
             logger.debug("[VideoRenderer] Audio probe failed (%s), defaulting to start of track.", exc)
 
-        vf = (
-            f"scale={_WIDTH}:{_HEIGHT}:force_original_aspect_ratio=decrease,"
-            f"pad={_WIDTH}:{_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black,"
-            f"fade=t=in:st=0:d={self.fade_sec},"
-            f"fade=t=out:st={fade_out_start}:d={self.fade_sec}"
-        )
-
         af = (
             f"afade=t=in:st=0:d={self.fade_sec},"
             f"afade=t=out:st={fade_out_start}:d={self.fade_sec}"
         )
 
+        # ── Video track: encode only the distinct segments ──────────── #
+        encoder = self._hw_encoder
+        concat_list, error = self._encode_video_segments(
+            frame_rgb, work_dir, quality, prefix=f"{output_path.stem}_",
+            encoder=encoder, threads=threads,
+        )
+        if concat_list is None and encoder is not None:
+            # Encoders can be compiled in without a usable device behind
+            # them.  The segment encode reads only the in-memory frame, so
+            # its failure is the encoder's; retry this render only.
+            logger.warning(
+                "[VideoRenderer] %s encode failed — falling back to %s.",
+                encoder,
+                _VIDEO_CODEC,
+            )
+            concat_list, error = self._encode_video_segments(
+                frame_rgb, work_dir, quality, prefix=f"{output_path.stem}_",
+                encoder=None, threads=threads,
+            )
+        if concat_list is None:
+            return RenderResult(
+                output_path=output_path,
+                duration_sec=self.duration_sec,
+                width=_WIDTH,
+                height=_HEIGHT,
+                success=False,
+                error_message=error,
+            )
+
+        # ── Final mux: stream-copy video, attach audio ────────────────── #
         cmd = [
             self.ffmpeg_path,
             "-y",                             # overwrite without prompt
-            "-loop", "1",                     # loop still image
-            "-i", str(frame_path),            # input 0: image
+            "-f", "concat", "-safe", "0",     # input 0: segment list
+            "-i", str(concat_list),
         ]
         
         # Apply the audio offset if we mapped one
@@ -291,65 +756,301 @@ class VideoRenderer:
         cmd.extend([
             "-i", str(audio_path),            # input 1: audio
             "-t", str(self.duration_sec),     # stop after N seconds
-            "-vf", vf,                        # video filter chain
+            "-map", "0:v:0",
+            "-map", "1:a:0",
+            "-c:v", "copy",                   # segments are already encoded
             "-af", af,                        # audio filter chain
-            "-r", str(self.fps),              # frame rate
-            "-c:v", _VIDEO_CODEC,
-            "-preset", _PRESET,
-            "-crf", str(_CRF),
             "-c:a", _AUDIO_CODEC,
             "-strict", "-2",                  # enable experimental AAC on legacy FFmpeg
             "-b:a", _AUDIO_BITRATE,
-            "-pix_fmt", "yuv420p",            # broadest compatibility
             "-shortest",                      # stop when shortest stream ends
             "-movflags", "+faststart",        # web-optimised atom placement
             str(output_path),
         ])
 
+        return self._run_ffmpeg(cmd, output_path)
+
+    def _encode_video_segments(
+        self,
+        frame_rgb: bytes,
+        work_dir: Path,
+        quality: str = "final",
+        prefix: str = "",
+        encoder: Optional[str] = None,
+        threads: int = 1,
+    ) -> tuple[Optional[Path], Optional[str]]:
+        """
+        Encode the still frame as a handful of short segments and write a
+        concat-demuxer list that stitches them into the full clip.
+
+        Only the fades differ frame to frame, so the clip is built from a
+        fade-in segment, a one-second hold segment repeated as often as
+        needed (plus a shorter remainder), and a fade-out segment.  Each
+        distinct segment is encoded once, all from one FFmpeg process;
+        the repeats are stream copies.
+
+        Parameters
+        ----------
+        frame_rgb : bytes
+            Composited frame as packed 1080 × 1920 RGB24, fed on stdin.
+        work_dir : Path
+            Directory the segments and concat list are written to.
+        quality : str
+            Key into ``_QUALITY_PRESETS``.
+        prefix : str
+            Filename prefix keeping concurrent jobs in a shared *work_dir*
+            apart.
+        encoder : str | None
+            Hardware encoder to use, or ``None`` for libx264.
+        threads : int
+            FFmpeg encoder / filter threads.
+
+        Returns
+        -------
+        tuple[Path | None, str | None]
+            Path to the concat list and ``None``, or ``None`` and the
+            FFmpeg error message if the encode failed.
+        """
+        total_frames = self.duration_sec * self.fps
+        fade_frames = min(round(self.fade_sec * self.fps), total_frames // 2)
+        hold_frames = total_frames - 2 * fade_frames
+        chunk_frames = min(self.fps, hold_frames)
+
+        # (segment name, frame count, fade filter or "")
+        segments: list[tuple[str, int, str]] = []
+        if fade_frames:
+            segments.append(("fade_in", fade_frames, f",fade=t=in:st=0:d={self.fade_sec}"))
+        if chunk_frames:
+            segments.append(("hold", chunk_frames, ""))
+        if chunk_frames and hold_frames % chunk_frames:
+            segments.append(("hold_tail", hold_frames % chunk_frames, ""))
+        if fade_frames:
+            segments.append(("fade_out", fade_frames, f",fade=t=out:st=0:d={self.fade_sec}"))
+
+        # A single FFmpeg process encodes every segment: the frame is
+        # read once, looped, split, and each branch trimmed to its length,
+        # so process start-up and codec init are paid once per render.
+        longest = max(frames for _, frames, _ in segments)
+        graph = (
+            f"[0:v]loop=loop={longest - 1}:size=1:start=0,"
+            f"setpts=N/({self.fps}*TB),format=yuv420p,split={len(segments)}"
+        )
+        graph += "".join(f"[{name}_src]" for name, _, _ in segments)
+        vaapi = encoder == _VAAPI_ENCODER
+        upload = ",format=nv12,hwupload" if vaapi else ""
+        for name, frames, fade in segments:
+            graph += f";[{name}_src]trim=end_frame={frames}{fade}{upload}[{name}]"
+
+        cmd = [
+            self.ffmpeg_path,
+            "-y",
+            "-f", "rawvideo",                 # single frame on stdin
+            "-pix_fmt", "rgb24",
+            "-s", f"{_WIDTH}x{_HEIGHT}",
+            "-framerate", str(self.fps),      # emit frames at output rate
+            "-i", "pipe:0",
+            "-filter_complex", graph,
+        ]
+        if vaapi:
+            cmd[1:1] = ["-vaapi_device", self._hw_device]
+        if self._ffmpeg_major >= 4:
+            # Explicit filter-graph threading (options added in FFmpeg 4)
+            cmd[1:1] = [
+                "-filter_threads", str(threads),
+                "-filter_complex_threads", str(threads),
+            ]
+        for name, frames, _ in segments:
+            cmd.extend([
+                "-map", f"[{name}]",
+                "-frames:v", str(frames),
+                "-threads", str(threads),
+                *self._video_codec_args(gop=frames, quality=quality, encoder=encoder),
+                "-an",
+                "-f", "mpegts",
+                str(work_dir / f"{prefix}{name}.ts"),
+            ])
+
+        error = self._exec_ffmpeg(cmd, stdin_data=frame_rgb)
+        if error is not None:
+            return None, error
+
+        order: list[str] = []
+        if fade_frames:
+            order.append("fade_in")
+        if chunk_frames:
+            order += ["hold"] * (hold_frames // chunk_frames)
+        if chunk_frames and hold_frames % chunk_frames:
+            order.append("hold_tail")
+        if fade_frames:
+            order.append("fade_out")
+
+        concat_list = work_dir / f"{prefix}segments.txt"
+        concat_list.write_text(
+            "".join(
+                "file '{}'\n".format(str(work_dir / f"{prefix}{name}.ts").replace("'", "'\\''"))
+                for name in order
+            ),
+            encoding="utf-8",
+        )
+        return concat_list, None
+
+    def _video_codec_args(
+        self, gop: int, quality: str = "final", encoder: Optional[str] = None
+    ) -> list[str]:
+        """
+        Return the ``-c:v`` argument block for *encoder*.
+
+        Parameters
+        ----------
+        gop : int
+            Keyframe interval in frames (one GOP per segment).
+        quality : str
+            Key into ``_QUALITY_PRESETS``; selects the libx264 preset / CRF.
+        encoder : str | None
+            Hardware encoder, or ``None`` for libx264.
+
+        Returns
+        -------
+        list[str]
+            Hardware encoder flags when *encoder* is set, otherwise the
+            libx264 still-image settings.
+        """
+        if encoder is not None:
+            return [
+                "-c:v", encoder,
+                *_HW_ENCODERS[encoder],
+                "-g", str(gop),
+            ]
+
+        # Static frame: a single GOP per segment lets libx264 emit one
+        # IDR followed by near-empty P-frames.
+        preset, crf = _QUALITY_PRESETS[quality]
+        if quality == "final" and self.x264_preset:
+            preset = self.x264_preset
+        return [
+            "-c:v", _VIDEO_CODEC,
+            "-preset", preset,
+            "-tune", _TUNE,                   # bias toward skip macroblocks
+            "-x264-params", (                 # one IDR, no scene cuts / B-frames
+                f"keyint={gop}:min-keyint={gop}:scenecut=0:bframes=0"
+            ),
+            "-crf", str(crf),
+        ]
+
+    def _exec_ffmpeg(
+        self, cmd: list[str], stdin_data: Optional[bytes] = None
+    ) -> Optional[str]:
+        """
+        Execute an FFmpeg command.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            FFmpeg argument list.
+        stdin_data : bytes | None
+            Payload written to FFmpeg's stdin (for ``-i pipe:0`` inputs).
+
+        Returns
+        -------
+        str | None
+            ``None`` on success, otherwise a short error description
+            (timeout, spawn failure, or the tail of stderr).
+        """
+        # Machine-readable progress on stderr lets stalled encodes be
+        # killed long before the overall timeout.
+        cmd = [cmd[0], "-progress", "pipe:2", "-nostats", *cmd[1:]]
         logger.debug("[VideoRenderer] FFmpeg command:\n  %s", " ".join(cmd))
 
+        # Stream stderr through a bounded tail instead of buffering it all
+        tail: deque[str] = deque(maxlen=_STDERR_TAIL)
+        last_progress = [time.monotonic()]
         try:
-            proc = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.duration_sec * 10,   # generous headroom
-            )
-        except subprocess.TimeoutExpired:
-            msg = f"FFmpeg timed out after {self.duration_sec * 10}s"
-            logger.error("[VideoRenderer] %s", msg)
-            return RenderResult(
-                output_path=output_path,
-                duration_sec=self.duration_sec,
-                width=_WIDTH,
-                height=_HEIGHT,
-                success=False,
-                error_message=msg,
+                stdin=subprocess.DEVNULL if stdin_data is None else subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                bufsize=_PIPE_BUFSIZE,
             )
         except Exception as exc:  # noqa: BLE001
             msg = f"FFmpeg subprocess error: {exc}"
             logger.error("[VideoRenderer] %s", msg)
-            return RenderResult(
-                output_path=output_path,
-                duration_sec=self.duration_sec,
-                width=_WIDTH,
-                height=_HEIGHT,
-                success=False,
-                error_message=msg,
+            return msg
+
+        workers = [
+            threading.Thread(
+                target=_drain_stderr,
+                args=(proc.stderr, tail, last_progress),
+                daemon=True,
+            )
+        ]
+        if stdin_data is not None:
+            workers.append(
+                threading.Thread(
+                    target=_feed_stdin, args=(proc.stdin, stdin_data), daemon=True
+                )
             )
+        for worker in workers:
+            worker.start()
+        timeout = self.duration_sec * 10     # generous headroom
+        stall_limit = self.duration_sec * 2  # no progress for this long → hung
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                try:
+                    returncode = proc.wait(timeout=_PROGRESS_POLL_SEC)
+                    break
+                except subprocess.TimeoutExpired:
+                    now = time.monotonic()
+                    if now > deadline:
+                        msg = f"FFmpeg timed out after {timeout}s"
+                    elif now - last_progress[0] > stall_limit:
+                        msg = f"FFmpeg stalled (no progress for {stall_limit}s)"
+                    else:
+                        continue
+                logger.error("[VideoRenderer] %s", msg)
+                return msg
+        finally:
+            # Killing FFmpeg also breaks the stdin pipe, releasing the feeder
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            for worker in workers:
+                worker.join(timeout=5)
 
-        if proc.returncode != 0:
-            stderr_tail = proc.stderr[-500:] if proc.stderr else "(no stderr)"
+        if returncode != 0:
+            stderr_tail = "".join(tail) or "(no stderr)"
             logger.error(
-                "[VideoRenderer] FFmpeg exited %d:\n%s", proc.returncode, stderr_tail
+                "[VideoRenderer] FFmpeg exited %d:\n%s", returncode, stderr_tail
             )
+            return stderr_tail
+        return None
+
+    def _run_ffmpeg(self, cmd: list[str], output_path: Path) -> RenderResult:
+        """
+        Execute the final FFmpeg command and wrap the outcome.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            FFmpeg argument list.
+        output_path : Path
+            Expected MP4 output path.
+
+        Returns
+        -------
+        RenderResult
+            Populated result object.
+        """
+        error = self._exec_ffmpeg(cmd)
+        if error is not None:
             return RenderResult(
                 output_path=output_path,
                 duration_sec=self.duration_sec,
                 width=_WIDTH,
                 height=_HEIGHT,
                 success=False,
-                error_message=stderr_tail,
+                error_message=error,
             )
 
         size_mb = output_path.stat().st_size / 1_048_576
@@ -363,25 +1064,3 @@ class VideoRenderer:
             height=_HEIGHT,
             success=True,
         )
-
-    # ------------------------------------------------------------------ #
-    #  Utility                                                             #
-    # ------------------------------------------------------------------ #
-
-    def _verify_ffmpeg(self) -> None:
-        """
-        Confirm that FFmpeg is available on the system.
-
-        Raises
-        ------
-        EnvironmentError
-            If the FFmpeg binary cannot be found.
-        """
-        resolved = shutil.which(self.ffmpeg_path)
-        if resolved is None:
-            raise EnvironmentError(
-                f"FFmpeg not found at '{self.ffmpeg_path}'. "
-                "Install FFmpeg and ensure it is on your system PATH, "
-                "or pass the full path via ffmpeg_path= during construction."
-            )
-        logger.info("[VideoRenderer] FFmpeg found at: %s", resolved)
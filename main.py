@@ -12,8 +12,17 @@ Optional flags (all have defaults):
     --ollama-url   Ollama server base URL           (default: http://localhost:11434)
     --no-trends    Skip Google Trends (pure random theme selection)
     --no-render    Skip video rendering (content generation only)
+    --preview      Fast low-quality encode for iterating on renders
+    --hwaccel      Hardware encoder: auto, none, nvenc, qsv, videotoolbox,
+                   amf, vaapi                       (default: auto)
+    --hwaccel-device  VAAPI render node             (default: /dev/dri/renderD128)
+    --ffmpeg-preset   libx264 preset for final renders (default: medium)
     --font-path    Path to a .ttf font for quote overlay
     --seed         Integer seed for reproducibility
+    --no-cache     Bypass the on-disk AI answer cache (.cache/llm/)
+    --batch        Number of videos to produce      (default: 1)
+    --concurrency  Batch runs in flight at once     (default: 1; pair with
+                   OLLAMA_NUM_PARALLEL on the Ollama server)
 
 AI backends (priority order):
     1. Google Gemini  (set GEMINI_API_KEY in .env)
@@ -35,13 +44,23 @@ Pipeline stages
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional
 
 import argparse
+import atexit
 import csv
+import functools
+import itertools
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # ── Project root on sys.path ──────────────────────────────────────── #
@@ -56,12 +75,15 @@ try:
 except ImportError:
     pass  # python-dotenv not installed — API key must be set in env
 
-from core.TrendAnalyzer import TrendAnalyzer
 from core.ThemeSelector import ThemeSelector, SelectedAssets
-from core.GeminiEngine import GeminiEngine, GeneratedContent
-from core.LLMEngine import GeneratedContent  # type: ignore[no-redef, assignment]
-from core.LLMEngine import GeneratedContent  # type: ignore[no-redef, assignment]
-from core.VideoRenderer import VideoRenderer, RenderResult
+from core.LLMCache import LLMCache
+
+# Heavy backends (pytrends / pandas, requests, Pillow) are imported by the
+# steps that use them, so --help and --no-trends / --no-render runs
+# don't pay for them.
+if TYPE_CHECKING:
+    from core.GeminiEngine import AssetPick, GeminiEngine, GeneratedContent
+    from core.VideoRenderer import RenderResult, VideoRenderer
 
 # ------------------------------------------------------------------ #
 #  Logging configuration                                               #
@@ -70,13 +92,30 @@ from core.VideoRenderer import VideoRenderer, RenderResult
 LOG_DIR = ROOT / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s  %(levelname)-8s  %(name)s — %(message)s",
+)
+
+# The log file is written from a listener thread, so logging calls never
+# block on disk.  Records are written as they arrive (no MemoryHandler
+# buffering) so ``tail -f`` works and a crash doesn't lose the tail of the
+# log.  The console stays synchronous so log lines keep their order
+# relative to the printed summary.
+_log_file_handler = logging.FileHandler(LOG_DIR / "moodloop.log", encoding="utf-8")
+_log_file_handler.setFormatter(_LOG_FORMATTER)
+_log_console_handler = logging.StreamHandler(sys.stdout)
+_log_console_handler.setFormatter(_LOG_FORMATTER)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)   # runs before logging's own shutdown
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Only merge msg % args here; the file handler applies _LOG_FORMATTER
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s  %(levelname)-8s  %(name)s — %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(LOG_DIR / "moodloop.log", encoding="utf-8"),
-    ],
+    handlers=[_log_console_handler, _log_queue_handler],
 )
 logger = logging.getLogger("moodloop.main")
 
@@ -89,6 +128,12 @@ BACKGROUNDS_DIR = ASSETS_DIR / "backgrounds"
 MUSIC_DIR = ASSETS_DIR / "music"
 OUTPUT_DIR = ROOT / "output"
 UPLOAD_CSV = ROOT / "upload_info.csv"
+LLM_CACHE_DIR = ROOT / ".cache" / "llm"
+FONTS_DIR = ASSETS_DIR / "fonts"
+
+_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+_MUSIC_EXTS = frozenset({".mp3", ".wav", ".aac", ".flac", ".m4a"})
+_MAX_FONT_CANDIDATES = 25   # cap to avoid huge requests
 
 CSV_FIELDNAMES: list[str] = [
     "video_name",
@@ -97,6 +142,361 @@ CSV_FIELDNAMES: list[str] = [
     "caption",
     "hashtags",
 ]
+_CSV_BUFFER_BYTES = 64 * 1024
+_CSV_FLUSH_ROWS = 32        # flush the CSV handle at least this often
+
+_HASHTAG_RE = re.compile(r'#\w+')
+# Whitespace and stray quotes the LLM wraps around titles / quotes
+_QUOTE_STRIP = " \t\r\n\"'"
+
+
+# ------------------------------------------------------------------ #
+#  Asset library index                                                 #
+# ------------------------------------------------------------------ #
+
+@dataclass
+class AssetIndex:
+    """
+    Candidate files offered to the AI asset picks in step 4.
+
+    Attributes
+    ----------
+    images : list[Path]
+        Background images in ``assets/backgrounds/``.
+    fonts : list[Path]
+        ``.ttf`` files under ``assets/fonts/`` (capped).
+    music : list[Path]
+        Audio tracks in ``assets/music/``.
+    """
+    images: list[Path]
+    fonts: list[Path]
+    music: list[Path]
+
+
+def _list_files(directory: Path, extensions: frozenset[str]) -> list[Path]:
+    """Return files in *directory* with a suffix in *extensions* ([] if missing)."""
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return []
+    return list(_scan_dir(directory, mtime_ns, extensions))
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_dir(
+    directory: Path, mtime_ns: int, extensions: frozenset[str]
+) -> tuple[Path, ...]:
+    """
+    Directory listing behind :func:`_list_files`, memoized per directory.
+
+    *mtime_ns* is only part of the cache key: adding, removing or
+    renaming a file bumps the directory's mtime and forces a rescan.
+    """
+    # scandir's DirEntry.is_file() uses the cached dirent type — no stat
+    with os.scandir(directory) as it:
+        return tuple(
+            Path(entry.path) for entry in it
+            if os.path.splitext(entry.name)[1].lower() in extensions
+            and entry.is_file()
+        )
+
+
+@functools.lru_cache(maxsize=2)
+def _scan_fonts(directory: Path, mtime_ns: int) -> tuple[Path, ...]:
+    """
+    Recursive ``.ttf`` listing, memoized like :func:`_scan_dir`.
+
+    Only the top-level mtime is tracked, so changes inside existing
+    font sub-folders are picked up on the next process start.
+    """
+    # Stop the directory walk once the cap is reached
+    return tuple(itertools.islice(directory.rglob("*.ttf"), _MAX_FONT_CANDIDATES))
+
+
+def _prescan_assets() -> AssetIndex:
+    """
+    Scan the asset library once so step 4 needn't touch the disk.
+
+    Run alongside the network-bound trends fetch in :func:`run_pipeline`.
+
+    Returns
+    -------
+    AssetIndex
+        Image, font, and music candidates.
+    """
+    try:
+        fonts = list(_scan_fonts(FONTS_DIR, FONTS_DIR.stat().st_mtime_ns))
+    except OSError:
+        fonts = []
+    return AssetIndex(
+        images=_list_files(BACKGROUNDS_DIR, _IMAGE_EXTS),
+        fonts=fonts,
+        music=_list_files(MUSIC_DIR, _MUSIC_EXTS),
+    )
+
+
+# ------------------------------------------------------------------ #
+#  Pipeline context                                                    #
+# ------------------------------------------------------------------ #
+
+@dataclass
+class PipelineCtx:
+    """
+    Per-run state shared by the pipeline steps.
+
+    Attributes
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments.
+    run_id : str
+        Unique identifier for this pipeline run.
+    engine : GeminiEngine
+        The one AI engine every step talks to.
+    asset_index : AssetIndex | None
+        Asset library scan from :func:`_prescan_assets`, if available.
+    """
+    args: argparse.Namespace
+    run_id: str
+    engine: GeminiEngine
+    asset_index: Optional[AssetIndex] = None
+
+
+# ------------------------------------------------------------------ #
+#  Upload CSV writer                                                   #
+# ------------------------------------------------------------------ #
+
+class _CsvLogger:
+    """
+    Append-only CSV writer that keeps its file handle open.
+
+    The file is opened lazily on the first row and the header is written
+    only if it is empty, so repeated runs in one process (loop / batch
+    mode) pay one open + stat in total rather than per row.  Rows go
+    through a 64 KiB buffer that is flushed every *flush_rows* rows and
+    on :meth:`close` (registered with ``atexit``).
+
+    Parameters
+    ----------
+    path : Path
+        CSV file to append to.
+    fieldnames : list[str]
+        Header row written to a new / empty file.
+    flush_rows : int
+        Number of buffered rows after which the handle is flushed.
+    """
+
+    def __init__(
+        self, path: Path, fieldnames: list[str], flush_rows: int = _CSV_FLUSH_ROWS
+    ) -> None:
+        self._path = path
+        self._fieldnames = fieldnames
+        self._flush_rows = flush_rows
+        self._pending = 0
+        self._fh: Optional[IO[str]] = None
+        self._writer: Any = None
+        self._lock = threading.Lock()   # concurrent batch runs share it
+
+    def write(self, row: tuple[str, ...]) -> None:
+        """Append *row* (in *fieldnames* order), opening the file if needed."""
+        with self._lock:
+            if self._fh is None:
+                self._fh = self._path.open(
+                    "a", newline="", encoding="utf-8", buffering=_CSV_BUFFER_BYTES
+                )
+                self._writer = csv.writer(self._fh)
+                if self._fh.tell() == 0:
+                    self._writer.writerow(self._fieldnames)
+            self._writer.writerow(row)
+            self._pending += 1
+            if self._pending >= self._flush_rows:
+                self._fh.flush()
+                self._pending = 0
+
+    def close(self) -> None:
+        """Flush and close the handle; the next write reopens it."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+                self._writer = None
+                self._pending = 0
+
+
+_UPLOAD_CSV_LOGGER = _CsvLogger(UPLOAD_CSV, CSV_FIELDNAMES)
+atexit.register(_UPLOAD_CSV_LOGGER.close)
+
+
+# ------------------------------------------------------------------ #
+#  Shared engine / selector / renderer                                 #
+# ------------------------------------------------------------------ #
+
+@functools.lru_cache(maxsize=4)
+def _get_engine(ollama_url: str, ollama_model: str) -> GeminiEngine:
+    """
+    Return a GeminiEngine shared by every step of the run.
+
+    Steps 3, 4, 5 and 7 all talk to the same backends, so one client
+    (and its HTTP connection pool) is built per URL/model pair.
+
+    Parameters
+    ----------
+    ollama_url : str
+        Base URL of the Ollama API server.
+    ollama_model : str
+        Ollama model tag.
+
+    Returns
+    -------
+    GeminiEngine
+        Cached engine instance.
+    """
+    from core.GeminiEngine import GeminiEngine
+
+    return GeminiEngine(ollama_url=ollama_url, ollama_model=ollama_model)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_selector(seed: Optional[int]) -> ThemeSelector:
+    """
+    Return the ThemeSelector for *seed*, built once per process.
+
+    Keeps its weight cache and RNG stream across runs, so sequential
+    runs with one seed stay reproducible as a sequence without repeating.
+    Concurrent batch runs would interleave draws on a shared stream, so
+    :func:`run_batch` gives each run its own seed (``seed + n``).
+    """
+    return ThemeSelector(
+        backgrounds_dir=BACKGROUNDS_DIR,
+        music_dir=MUSIC_DIR,
+        seed=seed,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_renderer(
+    font_path: Optional[Path],
+    hwaccel: str,
+    hwaccel_device: Optional[str],
+    x264_preset: Optional[str],
+) -> VideoRenderer:
+    """
+    Return a VideoRenderer shared by runs with the same font / encoder.
+
+    Reusing it keeps the TextOverlay's loaded fonts and any hardware
+    encoder fallback decided by an earlier render.
+
+    Raises
+    ------
+    EnvironmentError
+        If FFmpeg cannot be found (not cached; the next call retries).
+    """
+    from core.VideoRenderer import VideoRenderer
+
+    return VideoRenderer(
+        output_dir=OUTPUT_DIR,
+        quote_font_path=font_path,
+        hw_accel=hwaccel,
+        hw_device=hwaccel_device,
+        x264_preset=x264_preset,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cache() -> Optional[LLMCache]:
+    """
+    Return the shared on-disk AI answer cache, or ``None`` if unusable.
+    """
+    try:
+        return LLMCache(LLM_CACHE_DIR)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("AI answer cache unavailable (%s) — caching disabled.", exc)
+        return None
+
+
+def _cache_get(cache: Optional[LLMCache], key: str) -> Any:
+    """
+    Look *key* up in *cache*; a missing cache or failed read is a miss.
+    """
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("[Cache] Read failed (%s) — treating as a miss.", exc)
+        return None
+
+
+def _cache_set(cache: Optional[LLMCache], key: str, value: Any) -> None:
+    """
+    Store *value* under *key*; a failed write only costs the next run a call.
+    """
+    if cache is None:
+        return
+    try:
+        cache.set(key, value)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("[Cache] Write failed (%s) — answer not cached.", exc)
+
+
+def _warm_renderer(args: argparse.Namespace) -> None:
+    """
+    Run step 6's FFmpeg probes ahead of time (called off the main thread).
+    """
+    if args.no_render:
+        return
+    try:
+        from core.VideoRenderer import warm_up
+
+        warm_up(hw_accel=args.hwaccel)
+    except Exception as exc:  # noqa: BLE001
+        # Step 6 repeats the checks and reports the failure properly
+        logger.debug("Renderer warm-up failed: %s", exc)
+
+
+def _cached_pick(
+    args: argparse.Namespace,
+    key_parts: tuple,
+    candidates: list[Path],
+    pick: Callable[[], Optional["AssetPick"]],
+) -> Optional[Path]:
+    """
+    Run an engine ``pick_*`` call through the on-disk cache.
+
+    Only answers the model actually gave are stored; heuristic / theme
+    fallbacks (no API key, Gemini down) are returned but not cached, so
+    the next run asks the model again.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        CLI args (``--no-cache`` bypasses the cache).
+    key_parts : tuple
+        Inputs that determine the answer (method name first).
+    candidates : list[Path]
+        Paths the pick chooses from; a cached answer is only used while
+        it is still one of them.
+    pick : Callable[[], AssetPick | None]
+        The actual engine call.
+
+    Returns
+    -------
+    Path | None
+        Cached or freshly picked path.
+    """
+    cache = None if args.no_cache else _get_cache()
+    key = LLMCache.make_key(*key_parts)
+    by_path = {os.fspath(p): p for p in candidates}
+    hit = _cache_get(cache, key)
+    if isinstance(hit, str) and hit in by_path:
+        logger.info("[Cache] %s hit → %s", key_parts[0], by_path[hit].name)
+        return by_path[hit]
+
+    result = pick()
+    if result is None or result.path is None:
+        return None
+    if result.from_model:
+        _cache_set(cache, key, os.fspath(result.path))
+    return result.path
 
 
 # ------------------------------------------------------------------ #
@@ -123,6 +523,8 @@ def step_fetch_trends(args: argparse.Namespace) -> list[str]:
 
     logger.info("[Step 1] Fetching Google Trends data (geo=%s)…", args.geo)
     try:
+        from core.TrendAnalyzer import TrendAnalyzer
+
         analyzer = TrendAnalyzer(geo=args.geo)
         topics = analyzer.get_trending_topics()
         logger.info("[Step 1] %d trending topics retrieved.", len(topics))
@@ -153,12 +555,7 @@ def step_select_theme(
         Resolved theme + optional file paths.
     """
     logger.info("[Step 2] Selecting theme and resolving assets…")
-    selector = ThemeSelector(
-        backgrounds_dir=BACKGROUNDS_DIR,
-        music_dir=MUSIC_DIR,
-        seed=seed,
-    )
-    assets = selector.select(trending_topics)
+    assets = _get_selector(seed).select(trending_topics)
 
     if not assets.is_complete():
         logger.warning(
@@ -172,7 +569,7 @@ def step_select_theme(
 
 
 def step_generate_content(
-    assets: SelectedAssets, args: argparse.Namespace
+    ctx: PipelineCtx, assets: SelectedAssets
 ) -> GeneratedContent:
     """
     Step 3 — Generate quote, title, and caption via Gemini AI
@@ -180,22 +577,18 @@ def step_generate_content(
 
     Parameters
     ----------
+    ctx : PipelineCtx
+        Run context (AI engine).
     assets : SelectedAssets
         Theme metadata used to craft prompts.
-    args : argparse.Namespace
-        CLI args (ollama URL, model, etc.)
 
     Returns
     -------
     GeneratedContent
         All AI-generated text fields.
     """
-    logger.info("[Step 3] Initialising AI engine (Gemini → Ollama → HuggingFace)…")
-    engine = GeminiEngine(
-        ollama_url=args.ollama_url,
-        ollama_model=args.model,
-    )
-    content = engine.generate_all(
+    logger.info("[Step 3] Generating content (Gemini → Ollama → HuggingFace)…")
+    content = ctx.engine.generate_all(
         theme_name=assets.theme.display_name,
         mood=assets.theme.mood,
     )
@@ -207,10 +600,9 @@ def step_generate_content(
 
 
 def step_refine_assets(
-    run_id: str,
+    ctx: PipelineCtx,
     assets: SelectedAssets,
     content: GeneratedContent,
-    args: argparse.Namespace,
 ) -> SelectedAssets:
     """
     Step 4 — Use Gemini to pick the best image, font, and music
@@ -221,79 +613,113 @@ def step_refine_assets(
 
     Parameters
     ----------
+    ctx : PipelineCtx
+        Run context (CLI args, AI engine, prescanned asset library —
+        scanned here if absent).
     assets : SelectedAssets
         Initial asset selection from ThemeSelector.
     content : GeneratedContent
         Generated quote/title (used for AI matching).
-    args : argparse.Namespace
-        CLI args.
 
     Returns
     -------
     SelectedAssets
         Updated assets with Gemini-selected image/font/music.
     """
-    engine = GeminiEngine(
-        ollama_url=args.ollama_url,
-        ollama_model=args.model,
-    )
+    args, engine = ctx.args, ctx.engine
     mood = assets.theme.mood
     quote = content.quote
     logger.info("[Step 4] Asking Gemini to pick the best assets for quote: %r", quote)
+    index = ctx.asset_index if ctx.asset_index is not None else _prescan_assets()
+
+    # The three picks are independent network calls — run them together
+    # and apply the answers here, on the calling thread.
+    def pick_image() -> Optional[Path]:
+        image_candidates = index.images
+        if not image_candidates:
+            return None
+        return _cached_pick(
+            args,
+            ("pick_best_image", quote, mood, sorted(map(os.fspath, image_candidates))),
+            image_candidates,
+            lambda: engine.pick_image(quote, mood, image_candidates),
+        )
 
-    try:
-        image_candidates = [
-            p for p in BACKGROUNDS_DIR.iterdir()
-            if p.is_file() and p.suffix.lower() in {".jpg", ".jpeg", ".png", ".webp"}
-        ]
-        if image_candidates:
-            best_bg = engine.pick_best_image(quote, mood, image_candidates)
+    def pick_font() -> Optional[Path]:
+        font_candidates = index.fonts
+        if not font_candidates:
+            return None
+        theme_font = assets.font_path
+        return _cached_pick(
+            args,
+            ("pick_best_font", quote, mood,
+             sorted(map(os.fspath, font_candidates)),
+             os.fspath(theme_font) if theme_font else ""),
+            [*font_candidates, *([theme_font] if theme_font else [])],
+            lambda: engine.pick_font(
+                quote, mood, font_candidates,
+                theme_font=theme_font,
+            ),
+        )
+
+    def pick_music() -> Optional[Path]:
+        music_candidates = index.music
+        if not music_candidates:
+            return None
+        theme_music = assets.music_path
+        return _cached_pick(
+            args,
+            ("pick_best_music", mood,
+             sorted(map(os.fspath, music_candidates)),
+             os.fspath(theme_music) if theme_music else ""),
+            [*music_candidates, *([theme_music] if theme_music else [])],
+            lambda: engine.pick_music(
+                mood, music_candidates,
+                theme_music=theme_music,
+            ),
+        )
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        image_future = pool.submit(pick_image)
+        # only if user hasn't forced a font via CLI
+        font_future = None if args.font_path else pool.submit(pick_font)
+        music_future = pool.submit(pick_music)
+
+        # ── Best image ───────────────────────────────────────────────────
+        try:
+            best_bg = image_future.result()
             if best_bg and best_bg != assets.background_path:
                 logger.info("[Step 4] Picked image from library: %s", best_bg.name)
                 assets.background_path = best_bg
-    except Exception as exc:
-        logger.warning("[Step 4] Library image selection failed: %s", exc)
+        except Exception as exc:
+            logger.warning("[Step 4] Library image selection failed: %s", exc)
 
-    # ── Best font ────────────────────────────────────────────────────
-    if not args.font_path:  # only if user hasn't forced a font via CLI
-        try:
-            fonts_dir = ROOT / "assets" / "fonts"
-            font_candidates = list(fonts_dir.rglob("*.ttf"))[:25]  # cap to avoid huge requests
-            if font_candidates:
-                best_font = engine.pick_best_font(
-                    quote, mood, font_candidates,
-                    theme_font=assets.font_path,
-                )
+        # ── Best font ────────────────────────────────────────────────────
+        if font_future is not None:
+            try:
+                best_font = font_future.result()
                 if best_font:
                     logger.info("[Step 4] Gemini picked font: %s", best_font.name)
                     assets.font_path = best_font
-        except Exception as exc:
-            logger.warning("[Step 4] Font selection failed: %s", exc)
+            except Exception as exc:
+                logger.warning("[Step 4] Font selection failed: %s", exc)
 
-    # ── Best music ───────────────────────────────────────────────────
-    try:
-        music_candidates = [
-            p for p in MUSIC_DIR.iterdir()
-            if p.is_file() and p.suffix.lower() in {".mp3", ".wav", ".aac", ".flac", ".m4a"}
-        ]
-        if music_candidates:
-            best_music = engine.pick_best_music(
-                mood, music_candidates,
-                theme_music=assets.music_path,
-            )
+        # ── Best music ───────────────────────────────────────────────────
+        try:
+            best_music = music_future.result()
             if best_music and best_music != assets.music_path:
                 logger.info("[Step 4] Gemini picked music: %s", best_music.name)
                 assets.music_path = best_music
-    except Exception as exc:
-        logger.warning("[Step 4] Music selection failed: %s", exc)
+        except Exception as exc:
+            logger.warning("[Step 4] Music selection failed: %s", exc)
 
     return assets
 
 
 def step_peer_review(
+    ctx: PipelineCtx,
     assets: SelectedAssets,
     content: GeneratedContent,
-    args: argparse.Namespace,
 ) -> GeneratedContent:
     """
     Step 5 — AI Peer-Review (Improvise Output).
@@ -306,49 +732,62 @@ def step_peer_review(
         return content  # skip if missing assets
 
     logger.info("[Step 5] AI Peer-Review (improvising output to fit selected assets)…")
-    engine = GeminiEngine(
-        ollama_url=args.ollama_url,
-        ollama_model=args.model,
-    )
-    
+    engine = ctx.engine
+
     image_name = assets.background_path.name if assets.background_path else "unknown"
     font_name = assets.font_path.stem if assets.font_path else "unknown"
     music_name = assets.music_path.name if assets.music_path else "unknown"
     
+    cache = None if ctx.args.no_cache else _get_cache()
+    key = LLMCache.make_key(
+        "improvise_output", content.quote, image_name, font_name, music_name
+    )
+    hit = _cache_get(cache, key)
+    if isinstance(hit, dict) and {"quote", "model"} <= hit.keys():
+        logger.info("[Cache] improvise_output hit → %r", hit["quote"])
+        content.quote, content.model = hit["quote"], hit["model"]
+        return content
+
+    draft_model = content.model
     revised_content = engine.improvise_output(
         content,
         image_name=image_name,
         font_name=font_name,
         music_name=music_name,
     )
+    # Only upgrades are cached: an unchanged quote may mean the backend
+    # was unreachable rather than that it approved the draft.
+    if revised_content.model != draft_model:
+        _cache_set(
+            cache, key, {"quote": revised_content.quote, "model": revised_content.model}
+        )
     return revised_content
 
 
 def step_render_video(
-    run_id: str,
+    ctx: PipelineCtx,
     assets: SelectedAssets,
     content: GeneratedContent,
-    args: argparse.Namespace,
 ) -> Optional["RenderResult"]:
     """
     Step 6 — Render a 30-second vertical video via FFmpeg.
 
     Parameters
     ----------
-    run_id : str
-        Unique pipeline run identifier used for the output filename.
+    ctx : PipelineCtx
+        Run context (run id for the output filename; no-render / preview
+        flags and font path from the CLI args).
     assets : SelectedAssets
         Resolved background + music file paths.
     content : GeneratedContent
         AI-generated text (quote, title).
-    args : argparse.Namespace
-        CLI args (no-render flag, font path).
 
     Returns
     -------
     RenderResult | None
         Render result object, or ``None`` if rendering was skipped.
     """
+    args, run_id = ctx.args, ctx.run_id
     if args.no_render:
         logger.info("[Step 6] Video rendering skipped (--no-render).")
         return None
@@ -370,9 +809,8 @@ def step_render_video(
         else:
             font_path = None
 
-        renderer = VideoRenderer(
-            output_dir=OUTPUT_DIR,
-            quote_font_path=font_path,
+        renderer = _get_renderer(
+            font_path, args.hwaccel, args.hwaccel_device, args.ffmpeg_preset
         )
         result = renderer.render(
             run_id=run_id,
@@ -380,6 +818,9 @@ def step_render_video(
             music_path=assets.music_path,
             quote=content.quote,
             title=content.title,
+            quality="preview" if args.preview else "final",
+            # Step 7 needs the frame; skip the PNG when it can't run
+            keep_frame=bool(ctx.engine.gemini_api_key),
         )
         if result.success:
             logger.info("[Step 5] ✓ Video ready → %s", result.output_path)
@@ -395,9 +836,9 @@ def step_render_video(
 
 
 def step_validate_frame(
+    ctx: PipelineCtx,
     render_result: Optional["RenderResult"],
     content: GeneratedContent,
-    args: argparse.Namespace,
 ) -> None:
     """
     Step 7 — Use Gemini Vision to validate the rendered frame.
@@ -410,13 +851,8 @@ def step_validate_frame(
 
     logger.info("[Step 7] Validating rendered frame with Gemini Vision…")
     try:
-        engine = GeminiEngine(
-            ollama_url=args.ollama_url,
-            ollama_model=args.model,
-        )
-        # Find the frame PNG (TextOverlay saves it to a temp path; use the video as proxy)
-        frame_candidates = list(OUTPUT_DIR.glob(f"{render_result.output_path.stem}*.png"))
-        frame_path = frame_candidates[0] if frame_candidates else None
+        engine = ctx.engine
+        frame_path = render_result.overlay_frame_path
 
         if not frame_path:
             logger.info("[Step 6] No frame PNG found — skipping vision validation")
@@ -451,16 +887,16 @@ def step_log_upload_info(
     content : GeneratedContent
         LLM-generated text fields.
     render_result : RenderResult | None
-        Optional render result; output path recorded when present.
+        Render result whose MP4 the row names.  No row is written when
+        the render was skipped, crashed (``None``) or failed, since the
+        MP4 does not exist.
     """
-    write_header = not UPLOAD_CSV.exists()
-
-    video_name = ""
-    if render_result is not None and render_result.success:
-        video_name = render_result.output_path.name
-    else:
-        # Fall back to run_id-based filename even if skipped, to ensure data is logged
-        video_name = f"{run_id}.mp4"
+    if render_result is None or not render_result.success:
+        logger.warning(
+            "[Step 5] No rendered video — not logging upload info for %s.", run_id
+        )
+        return
+    video_name = render_result.output_path.name
 
     logger.info("[Step 5] Logging upload info to %s…", UPLOAD_CSV)
 
@@ -472,29 +908,25 @@ def step_log_upload_info(
         description = "\n\n".join(parts[:-1]).strip()
         hashtags = parts[-1].strip()
     else:
-        import re
-        hash_matches = re.findall(r'#\w+', raw_caption)
+        hash_matches = _HASHTAG_RE.findall(raw_caption)
         if hash_matches:
             hashtags = " ".join(hash_matches)
-            description = re.sub(r'#\w+', '', raw_caption).strip()
+            description = _HASHTAG_RE.sub('', raw_caption).strip()
         else:
             description = raw_caption
             hashtags = ""
 
-    row: dict[str, str | None] = {
-        "video_name": video_name,
-        "title": content.title.strip('"').strip("'").strip(),
-        "description": description,
-        "caption": content.quote.strip('"').strip("'").strip(),
-        "hashtags": hashtags,
-    }
+    # Same order as CSV_FIELDNAMES
+    row: tuple[str, ...] = (
+        video_name,
+        content.title.strip(_QUOTE_STRIP),
+        description,
+        content.quote.strip(_QUOTE_STRIP),
+        hashtags,
+    )
 
     try:
-        with UPLOAD_CSV.open("a", newline="", encoding="utf-8") as fh:
-            writer = csv.DictWriter(fh, fieldnames=CSV_FIELDNAMES)
-            if write_header:
-                writer.writeheader()
-            writer.writerow(row)
+        _UPLOAD_CSV_LOGGER.write(row)
         logger.info("[Step 5] Upload info row written for %s.", video_name)
     except OSError as exc:
         logger.error("[Step 5] Failed to write upload_info CSV: %s", exc)
@@ -571,6 +1003,35 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip video rendering; only generate text content.",
     )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Encode with fast preview settings (ultrafast preset, CRF 23).",
+    )
+    parser.add_argument(
+        "--hwaccel",
+        default="auto",
+        choices=["auto", "none", "nvenc", "qsv", "videotoolbox", "amf", "vaapi"],
+        help="H.264 encoder: probe for a GPU encoder (auto), force libx264 "
+             "(none), or force a specific one (default: auto).",
+    )
+    parser.add_argument(
+        "--hwaccel-device",
+        default=None,
+        dest="hwaccel_device",
+        metavar="PATH",
+        help="VAAPI render node for --hwaccel vaapi (default: /dev/dri/renderD128).",
+    )
+    parser.add_argument(
+        "--ffmpeg-preset",
+        default=None,
+        dest="ffmpeg_preset",
+        choices=[
+            "ultrafast", "superfast", "veryfast", "faster", "fast",
+            "medium", "slow", "slower", "veryslow",
+        ],
+        help="libx264 preset for final (non-preview) renders (default: medium).",
+    )
     parser.add_argument(
         "--font-path",
         default=None,
@@ -578,6 +1039,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         metavar="PATH",
         help="Path to a .ttf font for the quote text overlay.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Bypass the on-disk cache of AI asset picks and peer reviews.",
+    )
     parser.add_argument(
         "--seed",
         type=int,
@@ -585,6 +1052,21 @@ def build_arg_parser() -> argparse.ArgumentParser:
         metavar="N",
         help="Integer seed for reproducible theme/asset selection.",
     )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of videos to produce in this invocation (default: 1).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="K",
+        help="How many batch runs to execute at once (default: 1). "
+             "Set OLLAMA_NUM_PARALLEL on the Ollama server to match.",
+    )
     return parser
 
 
@@ -592,7 +1074,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
 #  Orchestrator                                                        #
 # ------------------------------------------------------------------ #
 
-def run_pipeline(args: argparse.Namespace) -> None:
+def run_pipeline(
+    args: argparse.Namespace,
+    run_id: Optional[str] = None,
+    trending_topics: Optional[list[str]] = None,
+) -> None:
     """
     Execute the full MoodLoop AI pipeline.
 
@@ -609,33 +1095,55 @@ def run_pipeline(args: argparse.Namespace) -> None:
     ----------
     args : argparse.Namespace
         Parsed CLI arguments.
+    run_id : str | None
+        Output / CSV identifier; defaults to the current timestamp.
+    trending_topics : list[str] | None
+        Topics already fetched by the caller (batch mode); stage 1 is
+        skipped when given.
     """
-    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_id = run_id or time.strftime("%Y%m%d_%H%M%S")
     logger.info("═══ MoodLoop AI — pipeline start (run_id=%s) ═══", run_id)
 
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Stage 1 ── Trend analysis
-    trending_topics = step_fetch_trends(args)
+    # Stage 1 ── Trend analysis (network) overlapped with the asset
+    # library scan (disk) that stage 4 needs
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        index_future = pool.submit(_prescan_assets)
+        if trending_topics is None:
+            trending_topics = step_fetch_trends(args)
+        asset_index = index_future.result()
+
+    ctx = PipelineCtx(
+        args=args,
+        run_id=run_id,
+        engine=_get_engine(args.ollama_url, args.model),
+        asset_index=asset_index,
+    )
 
     # Stage 2 ── Theme + initial asset selection
     assets = step_select_theme(trending_topics, seed=args.seed)
 
-    # Stage 3 ── AI content generation (Gemini → Ollama → HuggingFace)
-    content = step_generate_content(assets, args)
+    # Stage 3 ── AI content generation (Gemini → Ollama → HuggingFace),
+    # with the FFmpeg probes stage 6 needs running in the background
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(_warm_renderer, args)
+        content = step_generate_content(ctx, assets)
 
     # Stage 4 ── AI asset refinement (Gemini picks best image/font/music)
-    assets = step_refine_assets(run_id, assets, content, args)
+    assets = step_refine_assets(ctx, assets, content)
 
     # Stage 5 ── AI Peer-Review (Improvise text to perfectly fit assets)
-    content = step_peer_review(assets, content, args)
+    content = step_peer_review(ctx, assets, content)
 
     # Stage 6 ── Video rendering (with dynamic audio slicing)
-    render_result = step_render_video(run_id, assets, content, args)
+    render_result = step_render_video(ctx, assets, content)
 
-    # Stage 7 ── Gemini Vision frame validation
-    step_validate_frame(render_result, content, args)
+    # Stage 7 ── Gemini Vision frame validation (then drop the temp frame)
+    step_validate_frame(ctx, render_result, content)
+    if render_result is not None and render_result.overlay_frame_path is not None:
+        render_result.overlay_frame_path.unlink(missing_ok=True)
 
     # Stage 8 ── Upload Info logging
     step_log_upload_info(run_id, content, render_result)
@@ -646,15 +1154,96 @@ def run_pipeline(args: argparse.Namespace) -> None:
     logger.info("═══ Pipeline complete (run_id=%s) ═══", run_id)
 
 
+def run_batch(args: argparse.Namespace) -> None:
+    """
+    Produce ``args.batch`` videos, ``args.concurrency`` runs at a time.
+
+    Runs are threads in this process: every stage is network or FFmpeg
+    bound, and threads share the cached engine, renderer and CSV handle.
+    Google Trends is queried once for the whole batch.  Each run gets a
+    ``<timestamp>_<n>`` run id and, when ``--seed`` is set, its own seed
+    ``seed + n - 1`` so theme picks don't depend on thread scheduling.
+    For real LLM overlap, start Ollama with ``OLLAMA_NUM_PARALLEL`` ≥
+    concurrency (and ``OLLAMA_MAX_LOADED_MODELS=1``).
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed CLI arguments.
+    """
+    base = time.strftime("%Y%m%d_%H%M%S")
+    run_ids = [f"{base}_{n:03d}" for n in range(1, args.batch + 1)]
+    workers = max(1, min(args.concurrency, args.batch))
+    logger.info(
+        "═══ Batch of %d run(s), %d concurrent ═══", len(run_ids), workers
+    )
+
+    trending_topics = step_fetch_trends(args)
+    run_args = [
+        args if args.seed is None else argparse.Namespace(**{**vars(args), "seed": args.seed + i})
+        for i in range(len(run_ids))
+    ]
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_pipeline, a, run_id, trending_topics)
+            for a, run_id in zip(run_args, run_ids)
+        ]
+        for run_id, future in zip(run_ids, futures):
+            try:
+                future.result()
+            except Exception:  # noqa: BLE001
+                failed += 1
+                logger.exception("Batch run %s failed", run_id)
+
+    logger.info(
+        "═══ Batch complete: %d ok, %d failed ═══", len(run_ids) - failed, failed
+    )
+
+
+def run_pipeline_from_dict(cfg: dict[str, Any]) -> None:
+    """
+    Run the pipeline from a plain settings dict instead of ``sys.argv``.
+
+    For programmatic / batch callers.  Keys are the CLI option
+    destinations (``geo``, ``no_render``, ``seed``, …); anything omitted
+    takes the CLI default.
+
+    Parameters
+    ----------
+    cfg : dict[str, Any]
+        Overrides for the CLI defaults.
+
+    Raises
+    ------
+    ValueError
+        If *cfg* contains a key that is not a CLI option.
+    """
+    defaults = vars(_get_parser().parse_args([]))
+    unknown = cfg.keys() - defaults.keys()
+    if unknown:
+        raise ValueError(f"Unknown pipeline option(s): {sorted(unknown)}")
+    run_pipeline(argparse.Namespace(**{**defaults, **cfg}))
+
+
 # ------------------------------------------------------------------ #
 #  Entry point                                                         #
 # ------------------------------------------------------------------ #
 
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built once per process."""
+    return build_arg_parser()
+
+
 def main() -> None:
     """Parse CLI arguments and launch the pipeline."""
-    parser = build_arg_parser()
-    args = parser.parse_args()
-    run_pipeline(args)
+    args = _get_parser().parse_args()
+    if args.batch > 1:
+        run_batch(args)
+    else:
+        run_pipeline(args)
 
 
 if __name__ == "__main__":
@@ -23,12 +23,18 @@ Directory layout expected (all files optional):
 from __future__ import annotations
 
 import logging
+import os
 import random
+import time
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Coarsest common directory mtime granularity (FAT); a listing taken within
+# this window of a directory's mtime may miss a file added in the same tick
+_MTIME_GRANULARITY_NS: int = 2_000_000_000
+
 
 class AssetManager:
     """
@@ -53,6 +59,9 @@ class AssetManager:
     AUDIO_EXT: frozenset[str] = frozenset(
         {".mp3", ".wav", ".aac", ".flac", ".ogg", ".m4a"}
     )
+    # Same sets as tuples, the form str.endswith() takes
+    _IMAGE_SUFFIXES: tuple[str, ...] = tuple(sorted(IMAGE_EXT))
+    _AUDIO_SUFFIXES: tuple[str, ...] = tuple(sorted(AUDIO_EXT))
 
     def __init__(
         self,
@@ -64,9 +73,16 @@ class AssetManager:
         self.music_dir = Path(music_dir)
         self._rng = random.Random(seed)
 
-        # Anti-repetition state: stores the last returned path per category
-        self._last_background: Optional[Path] = None
-        self._last_music: Optional[Path] = None
+        # Anti-repetition state: stores the last returned path per category.
+        # Pools and picks are plain path strings internally; Path objects
+        # are only built for the value handed back to the caller.
+        self._last_background: Optional[str] = None
+        self._last_music: Optional[str] = None
+
+        # (root, theme_name) → (directory mtimes, pool, settled); see _build_pool
+        self._pool_cache: dict[
+            tuple[Path, Optional[str]], tuple[tuple[int, ...], list[str], bool]
+        ] = {}
 
         self._ensure_dirs()
         logger.debug(
@@ -98,18 +114,19 @@ class AssetManager:
             Absolute path to the chosen image, or ``None`` if the pool
             is empty.
         """
-        pool = self._build_pool(self.backgrounds_dir, self.IMAGE_EXT, theme_name)
+        pool = self._build_pool(self.backgrounds_dir, self._IMAGE_SUFFIXES, theme_name)
         chosen = self._pick(pool, self._last_background)
-        if chosen:
-            self._last_background = chosen
-            logger.info("AssetManager: background → %s", chosen.name)
-        else:
+        if chosen is None:
             logger.warning(
                 "AssetManager: no background images found in %s (theme=%r).",
                 self.backgrounds_dir,
                 theme_name,
             )
-        return chosen
+            return None
+        self._last_background = chosen
+        path = Path(chosen)
+        logger.info("AssetManager: background → %s", path.name)
+        return path
 
     def get_music(self, theme_name: Optional[str] = None) -> Optional[Path]:
         """
@@ -125,24 +142,29 @@ class AssetManager:
         Path | None
             Absolute path to the chosen audio file, or ``None`` if empty.
         """
-        pool = self._build_pool(self.music_dir, self.AUDIO_EXT, theme_name)
+        pool = self._build_pool(self.music_dir, self._AUDIO_SUFFIXES, theme_name)
         chosen = self._pick(pool, self._last_music)
-        if chosen:
-            self._last_music = chosen
-            logger.info("AssetManager: music → %s", chosen.name)
-        else:
+        if chosen is None:
             logger.warning(
                 "AssetManager: no music files found in %s (theme=%r).",
                 self.music_dir,
                 theme_name,
             )
-        return chosen
+            return None
+        self._last_music = chosen
+        path = Path(chosen)
+        logger.info("AssetManager: music → %s", path.name)
+        return path
 
     def refresh(self) -> None:
-        """Reset the anti-repetition cache so any asset can be returned next."""
+        """
+        Reset the anti-repetition cache so any asset can be returned next,
+        and drop cached directory listings.
+        """
         self._last_background = None
         self._last_music = None
-        logger.debug("AssetManager: anti-repetition cache cleared.")
+        self._pool_cache.clear()
+        logger.debug("AssetManager: anti-repetition and pool caches cleared.")
 
     # ------------------------------------------------------------------ #
     #  Private helpers                                                     #
@@ -151,9 +173,9 @@ class AssetManager:
     def _build_pool(
         self,
         root: Path,
-        extensions: frozenset[str],
+        suffixes: tuple[str, ...],
         theme_name: Optional[str],
-    ) -> list[Path]:
+    ) -> list[str]:
         """
         Collect eligible files from *root*, with optional theme sub-directory.
 
@@ -161,27 +183,67 @@ class AssetManager:
           1. ``root / theme_name /`` (theme-specific, if folder exists)
           2. ``root /`` (flat fallback pool)
 
+        Listings are cached per ``(root, theme_name)`` and reused while the
+        modification times of *root* and the theme sub-directory are
+        unchanged, so steady-state calls cost one or two ``stat`` calls.
+        A listing taken within ``_MTIME_GRANULARITY_NS`` of a directory's
+        mtime is not reused, since a file added in the same timestamp
+        tick would leave the mtime unchanged.  Missing directories give
+        an empty pool.
+
         Parameters
         ----------
         root : Path
             Base directory to search.
-        extensions : frozenset[str]
+        suffixes : tuple[str, ...]
             Allowed file extensions (lowercase, leading dot).
         theme_name : str | None
             Theme label used to look up a sub-directory.
 
         Returns
         -------
-        list[Path]
-            All matching file paths (may be empty).
+        list[str]
+            All matching file paths (may be empty).  The list is shared with
+            the cache — do not mutate it.
         """
-        candidates: list[Path] = []
+        key = (root, theme_name)
+        scanned_at = time.time_ns()
+        stamp = self._dir_stamp(root, theme_name)
+        cached = self._pool_cache.get(key)
+        if cached is not None and cached[2] and cached[0] == stamp:
+            return cached[1]
+
+        candidates = self._scan_pool(root, suffixes, theme_name)
+        settled = all(scanned_at - mtime >= _MTIME_GRANULARITY_NS for mtime in stamp)
+        self._pool_cache[key] = (stamp, candidates, settled)
+        return candidates
+
+    @staticmethod
+    def _dir_stamp(root: Path, theme_name: Optional[str]) -> tuple[int, ...]:
+        """Return the mtimes that invalidate a cached pool for *root* (``-1`` if missing)."""
+        dirs = [root, root / theme_name] if theme_name else [root]
+        stamp: list[int] = []
+        for directory in dirs:
+            try:
+                stamp.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                stamp.append(-1)
+        return tuple(stamp)
+
+    def _scan_pool(
+        self,
+        root: Path,
+        suffixes: tuple[str, ...],
+        theme_name: Optional[str],
+    ) -> list[str]:
+        """Uncached body of :meth:`_build_pool`."""
+        candidates: list[str] = []
 
         # 1. Theme-specific sub-directory
         if theme_name:
             theme_dir = root / theme_name
             if theme_dir.is_dir():
-                candidates = self._list_files(theme_dir, extensions)
+                candidates = self._list_files(theme_dir, suffixes)
                 if candidates:
                     logger.debug(
                         "AssetManager: found %d files in theme sub-dir %s",
@@ -191,7 +253,7 @@ class AssetManager:
                     return candidates
 
         # 2. Flat root pool (all files, excluding sub-directories)
-        candidates = self._list_files(root, extensions)
+        candidates = self._list_files(root, suffixes)
         logger.debug(
             "AssetManager: flat pool → %d files in %s", len(candidates), root
         )
@@ -199,9 +261,9 @@ class AssetManager:
 
     def _pick(
         self,
-        pool: list[Path],
-        last: Optional[Path],
-    ) -> Optional[Path]:
+        pool: list[str],
+        last: Optional[str],
+    ) -> Optional[str]:
         """
         Choose a random file from *pool* that differs from *last*.
 
@@ -210,30 +272,51 @@ class AssetManager:
 
         Parameters
         ----------
-        pool : list[Path]
-            Available files.
-        last : Path | None
-            Previously selected file to avoid.
+        pool : list[str]
+            Available file paths.
+        last : str | None
+            Previously selected path to avoid.
 
         Returns
         -------
-        Path | None
+        str | None
         """
         if not pool:
             return None
 
-        # Filter out the previous pick when more than one option exists
-        filtered = [p for p in pool if p != last] if last and len(pool) > 1 else pool
-        return self._rng.choice(filtered)
+        n = len(pool)
+        idx = self._rng.randrange(n)
+        if n > 1 and pool[idx] == last:
+            # Step uniformly over the other n-1 entries instead of copying
+            # the pool without *last*.
+            idx = (idx + 1 + self._rng.randrange(n - 1)) % n
+        return pool[idx]
 
     @staticmethod
-    def _list_files(directory: Path, extensions: frozenset[str]) -> list[Path]:
-        """Return all files directly inside *directory* with matching extensions."""
-        return [
-            f
-            for f in directory.iterdir()
-            if f.is_file() and f.suffix.lower() in extensions
-        ]
+    def _list_files(directory: Path, suffixes: tuple[str, ...]) -> list[str]:
+        """
+        Return paths of all files directly inside *directory* with matching
+        extensions.  Hidden files (``.png``, macOS ``._foo.jpg`` resource
+        forks) are skipped: they match by name but don't decode.
+        """
+        # scandir's DirEntry reuses the readdir file type, so this avoids
+        # a stat() per non-matching entry; endswith() with a tuple tests
+        # every suffix in one C call.
+        files: list[str] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if (
+                        not name.startswith(".")
+                        and name.lower().endswith(suffixes)
+                        and entry.is_file()
+                    ):
+                        files.append(entry.path)
+        except OSError as exc:
+            # Deleted / not yet created root: an empty pool, as before caching
+            logger.debug("AssetManager: cannot list %s: %s", directory, exc)
+        return files
 
     def _ensure_dirs(self) -> None:
         """Create asset directories if they are missing (warn, don't crash)."""
@@ -6,25 +6,36 @@ Production-grade FFmpeg-based video renderer for MoodLoop AI.
 Generates a 30-second 1080 × 1920 (9:16) vertical MP4 with:
 
   • Ken Burns slow-zoom effect (configurable start/end scale & position)
-  • Centred multi-line text overlay drawn with FFmpeg's drawtext filter
-    (no Pillow dependency in this module)
+  • Centred multi-line text overlay, rasterised once with Pillow and
+    composited with FFmpeg's ``overlay`` filter (falls back to the
+    ``drawtext`` filter when Pillow is not installed)
   • Background music with fade-in / fade-out
-  • H.264 video + AAC audio, web-optimised output (faststart)
+  • H.264 video + AAC audio, web-optimised output (faststart); a
+    hardware encoder (NVENC / QSV / VideoToolbox / VAAPI) is used when
+    FFmpeg has one, with libx264 as the fallback; hardware HEVC is
+    available as an opt-in (``hevc=True``) for smaller files
 
-This module is intentionally self-contained: it only relies on the
-Python standard library + FFmpeg on the system PATH.
+This module only requires the Python standard library + FFmpeg on the
+system PATH; Pillow is optional.
 """
 
 from __future__ import annotations
 
+import collections
+import functools
+import hashlib
 import logging
+import math
+import os
 import random
+import re
 import shutil
 import subprocess
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +52,45 @@ _AUDIO_BITRATE: str = "192k"
 _CRF: int = 22
 _PRESET: str = "medium"
 _PIX_FMT: str = "yuv420p"
+# Fixed argv slices shared by every command
+_X264_ARGS: tuple[str, ...] = ("-c:v", _VIDEO_CODEC, "-preset", _PRESET, "-crf", str(_CRF))
+_OUTPUT_ARGS: tuple[str, ...] = (
+    "-c:a", _AUDIO_CODEC,
+    "-b:a", _AUDIO_BITRATE,
+    "-shortest",
+    "-movflags", "+faststart",
+)
+_HW_PIX_FMT: str = "nv12"     # native surface layout of the hardware encoders
+
+# Hardware H.264 encoders in order of preference → quality flags
+# (roughly matching libx264 at _CRF).  Probed once per renderer.
+_HW_ENCODERS: dict[str, tuple[str, ...]] = {
+    "h264_nvenc": ("-preset", "p5", "-rc", "vbr", "-cq", "23", "-b:v", "0"),
+    "h264_qsv": ("-preset", "medium", "-global_quality", "23"),
+    "h264_videotoolbox": ("-q:v", "55"),
+    "h264_vaapi": ("-qp", "23"),
+}
+# Opt-in HEVC counterparts: ~40 % smaller files at the same quality,
+# encoded on the same ASICs.  There is no software HEVC fallback
+# (libx265 is several times slower than libx264), so without one of
+# these the renderer stays on H.264.
+_HEVC_ENCODERS: dict[str, tuple[str, ...]] = {
+    "hevc_nvenc": ("-preset", "p5", "-rc", "vbr", "-cq", "25", "-b:v", "0"),
+    "hevc_qsv": ("-preset", "medium", "-global_quality", "25"),
+    "hevc_videotoolbox": ("-q:v", "55"),
+    "hevc_vaapi": ("-qp", "25"),
+}
+_ENCODER_FLAGS: dict[str, tuple[str, ...]] = {**_HW_ENCODERS, **_HEVC_ENCODERS}
+_VAAPI_DEVICE: str = "/dev/dri/renderD128"
+_STDERR_TAIL_LINES: int = 20  # FFmpeg stderr lines kept for error messages
+# Stderr fragments meaning the video encoder itself failed (no device,
+# missing driver, rejected parameters) rather than an input
+_ENCODER_ERROR_MARKERS: tuple[str, ...] = (
+    "Error while opening encoder",
+    "Error initializing output stream",
+    "Device creation failed",
+    "hwupload",
+)
 
 # Ken Burns defaults
 _KB_ZOOM_START: float = 1.0    # scale factor at frame 0  (1.0 = fill canvas)
@@ -53,6 +103,217 @@ _FONT_SHADOW_COLOR: str = "black@0.65"
 _BOX_COLOR: str = "black@0.45"
 _BOX_BORDER: int = 28          # px padding around text box
 _MAX_LINE_LEN: int = 28        # chars before wrapping
+_TEXT_CENTRE: float = 0.60     # vertical centre of the text block (fraction of height)
+_SHADOW_OFFSET: int = 2        # px drop-shadow offset
+# Rasterised quote cards live in the repo's gitignored .cache/, not next
+# to the MP4s; the least recently used are pruned beyond _TEXT_CACHE_MAX
+_TEXT_CACHE_DIR: Path = Path(__file__).resolve().parent.parent / ".cache" / "textcards"
+_TEXT_CACHE_MAX: int = 200
+
+_WORD_RE = re.compile(r"\S+")
+# "ffmpeg version 6.1.1 ..." → 6; legacy "N-55702-g920046a" builds → no group
+_FFMPEG_VERSION_RE = re.compile(r"version\s+(?:N-\d+-\w+|(\d+))")
+
+
+# ------------------------------------------------------------------ #
+#  FFmpeg probes                                                       #
+# ------------------------------------------------------------------ #
+# Cached per binary so every renderer (and every render_many batch)
+# shares one ``which`` / ``-version`` / ``-encoders`` probe.
+
+@functools.lru_cache(maxsize=8)
+def _resolve_ffmpeg(ffmpeg_path: str) -> str:
+    """
+    Confirm the FFmpeg binary is reachable.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        Binary name or path as passed to :class:`VideoRenderer`.
+
+    Returns
+    -------
+    str
+        Absolute path of the resolved binary.
+
+    Raises
+    ------
+    EnvironmentError
+        If ``shutil.which`` cannot find the binary.
+    """
+    resolved = shutil.which(ffmpeg_path)
+    if resolved is None:
+        raise EnvironmentError(
+            f"FFmpeg not found at '{ffmpeg_path}'. "
+            "Install FFmpeg and add it to your system PATH, or pass the "
+            "full path via ffmpeg_path= during construction.\n"
+            "Windows: https://www.gyan.dev/ffmpeg/builds/\n"
+            "macOS:   brew install ffmpeg\n"
+            "Linux:   sudo apt install ffmpeg"
+        )
+    logger.info("[VideoRenderer] FFmpeg found → %s", resolved)
+    return resolved
+
+@functools.lru_cache(maxsize=8)
+def _probe_hw_encoder(ffmpeg_path: str, hevc: bool = False) -> Optional[str]:
+    """
+    Return the first hardware encoder listed by ``ffmpeg -encoders``.
+
+    VAAPI is only considered when its render node exists.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        FFmpeg binary to probe.
+    hevc : bool
+        Look for an HEVC encoder first, then fall back to H.264.
+
+    Returns
+    -------
+    str | None
+        Encoder name (e.g. ``"h264_nvenc"``), or ``None`` when none is
+        available or the probe fails, in which case libx264 is used.
+    """
+    try:
+        proc = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("[VideoRenderer] Encoder probe failed: %s", exc)
+        return None
+
+    available = set((proc.stdout or "").split())
+    candidates = [*_HEVC_ENCODERS, *_HW_ENCODERS] if hevc else list(_HW_ENCODERS)
+    for name in candidates:
+        if name not in available:
+            continue
+        if name.endswith("_vaapi") and not os.path.exists(_VAAPI_DEVICE):
+            continue
+        logger.info("[VideoRenderer] Hardware encoder available: %s", name)
+        return name
+    return None
+
+@functools.lru_cache(maxsize=8)
+def _probe_ffmpeg_major(ffmpeg_path: str) -> int:
+    """
+    Parse ``ffmpeg -version`` to extract the major version number.
+
+    Parameters
+    ----------
+    ffmpeg_path : str
+        FFmpeg binary to probe.
+
+    Returns
+    -------
+    int
+        Major version (e.g. ``6`` for FFmpeg 6.1.1).
+        Returns ``0`` if detection fails so the compat path is used.
+    """
+    try:
+        proc = subprocess.run(
+            [ffmpeg_path, "-version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        # First line looks like: "ffmpeg version 6.1.1 ..."
+        # or legacy:             "ffmpeg version N-55702-g920046a ..."
+        first_line = (proc.stdout or proc.stderr or "").splitlines()[0]
+        m = _FFMPEG_VERSION_RE.search(first_line)
+        if m and m.group(1):
+            major = int(m.group(1))
+            logger.debug("[VideoRenderer] FFmpeg major version: %d", major)
+            return major
+        # Legacy build string like N-55702-g920046a has no numeric version
+        logger.debug("[VideoRenderer] FFmpeg version string '%s' — treating as legacy (< 4).", first_line.strip())
+        return 0
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("[VideoRenderer] Could not detect FFmpeg version: %s — using compat mode.", exc)
+        return 0
+
+
+def _even(n: float) -> int:
+    """
+    Round *n* up to the next even integer.
+
+    yuv420p / NV12 store chroma per 2×2 block, so frame sizes must be
+    even (libx264 aborts otherwise) and overlay offsets should be.
+    """
+    return (math.ceil(n) + 1) & ~1
+
+
+@functools.lru_cache(maxsize=64)
+def _wrap_lines(text: str, max_chars: int) -> tuple[str, ...]:
+    """
+    Greedy word wrap behind :meth:`VideoRenderer._wrap_text`.
+
+    Packs whitespace-separated words into lines of at most *max_chars*
+    characters in one pass; words longer than a line are split, as
+    ``textwrap.wrap`` does.  Cached, since the same quote is typically
+    wrapped for the PNG card, the drawtext fallback and any re-render.
+    """
+    lines: list[str] = []
+    for paragraph in text.splitlines():
+        current: list[str] = []
+        length = 0
+        for match in _WORD_RE.finditer(paragraph):
+            word = match.group()
+            if len(word) > max_chars:
+                if current:
+                    # Start the long word in the current line's free space
+                    room = max_chars - length - 1
+                    if room > 0:
+                        current.append(word[:room])
+                        word = word[room:]
+                    lines.append(" ".join(current))
+                    current, length = [], 0
+                while len(word) > max_chars:
+                    lines.append(word[:max_chars])
+                    word = word[max_chars:]
+            if current and length + 1 + len(word) > max_chars:
+                lines.append(" ".join(current))
+                current, length = [], 0
+            length += len(word) + (1 if current else 0)
+            current.append(word)
+        if current:
+            lines.append(" ".join(current))
+    return tuple(lines) or (text.strip(),)
+
+
+def _is_encoder_error(message: Optional[str], venc: str) -> bool:
+    """
+    Tell whether an FFmpeg error tail blames the video encoder *venc*.
+
+    Input problems (a missing music file, an undecodable image) fail
+    the same way with libx264, so only encoder failures warrant a retry.
+    """
+    if not message:
+        return False
+    return venc in message or any(m in message for m in _ENCODER_ERROR_MARKERS)
+
+
+def _prune_text_cache(cache_dir: Path, keep: int) -> None:
+    """
+    Delete all but the *keep* most recently used cards in *cache_dir*.
+
+    Cache hits refresh a card's mtime, so mtime order is LRU order.
+    Files removed concurrently by another worker are ignored.
+    """
+    try:
+        cards = [(entry.stat().st_mtime_ns, entry) for entry in cache_dir.glob("*.png")]
+    except OSError:
+        return
+    if len(cards) <= keep:
+        return
+    cards.sort(reverse=True)
+    for _, stale in cards[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
 
 
 # ------------------------------------------------------------------ #
@@ -170,7 +431,9 @@ class VideoRenderer:
     The render pipeline:
       1. Scale & pad the background image to 1080 × 1920.
       2. Apply Ken Burns slow-zoom via FFmpeg's ``zoompan`` filter.
-      3. Burn centred, word-wrapped text onto every frame with ``drawtext``.
+      3. Composite the centred, word-wrapped text card (rasterised once
+         with Pillow) onto every frame with ``overlay``; ``drawtext``
+         is used when Pillow is missing.
       4. Apply video fade-in / fade-out.
       5. Mix the background music track, trim to *duration*, apply
          audio fade-in / fade-out.
@@ -188,6 +451,14 @@ class VideoRenderer:
         Frame rate of the output video (default: 30).
     fade_sec : float
         Duration of video + audio fade transitions (default: 1.0 s).
+    hw_accel : bool
+        Probe for a hardware H.264 encoder and prefer it over libx264
+        (default: ``True``).  A failed hardware encode is retried once
+        with libx264.
+    hevc : bool
+        Prefer a hardware HEVC encoder (tagged ``hvc1``) for smaller
+        files (default: ``False``).  Ignored when *hw_accel* is off or
+        no HEVC encoder is available.
     """
 
     def __init__(
@@ -197,16 +468,39 @@ class VideoRenderer:
         duration_sec: int = _DURATION,
         fps: int = _FPS,
         fade_sec: float = _FADE_SEC,
+        hw_accel: bool = True,
+        hevc: bool = False,
     ) -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._text_cache_dir = _TEXT_CACHE_DIR
         self.ffmpeg_path = ffmpeg_path
         self.duration_sec = duration_sec
         self.fps = fps
         self.fade_sec = fade_sec
 
-        self._verify_ffmpeg()
-        self._ffmpeg_major = self._detect_ffmpeg_major()
+        # Filter pieces that only depend on duration / fps / fades are
+        # formatted once here rather than on every render
+        self._total_frames = duration_sec * fps
+        self._duration_arg = str(duration_sec)
+        self._fps_arg = str(fps)
+        fade_out_start = duration_sec - fade_sec
+        self._vfade = (
+            f"fade=t=in:st=0:d={fade_sec},"
+            f"fade=t=out:st={fade_out_start}:d={fade_sec}"
+        )
+        self._af = (
+            f"atrim=0:{duration_sec},"
+            f"asetpts=PTS-STARTPTS,"
+            f"afade=t=in:st=0:d={fade_sec},"
+            f"afade=t=out:st={fade_out_start}:d={fade_sec}"
+        )
+
+        _resolve_ffmpeg(self.ffmpeg_path)
+        self._ffmpeg_major = _probe_ffmpeg_major(self.ffmpeg_path)
+        self._venc: Optional[str] = _probe_hw_encoder(self.ffmpeg_path, hevc) if hw_accel else None
+        # Encoder / filter threads per render (split across render_many workers)
+        self._threads = max(1, os.cpu_count() or 1)
         if self._ffmpeg_major >= 4:
             logger.info("[VideoRenderer] FFmpeg %d detected — Ken Burns (zoompan) enabled.", self._ffmpeg_major)
         else:
@@ -257,22 +551,99 @@ class VideoRenderer:
         RenderResult
             Populated result object.
         """
+        return self._render_job(
+            self._threads, run_id, background_path, music_path, text_config, ken_burns
+        )
+
+    def _render_job(
+        self,
+        threads: int,
+        run_id: str,
+        background_path: Path,
+        music_path: Path,
+        text_config: TextConfig,
+        ken_burns: Optional[KenBurnsConfig] = None,
+    ) -> RenderResult:
+        """
+        :meth:`render` with an explicit FFmpeg thread count.
+
+        Everything that varies per call (threads, the libx264 fallback)
+        stays local, so concurrent renders on one instance don't interfere.
+        """
         if ken_burns is None:
             ken_burns = KenBurnsConfig()
 
         output_path = self.output_dir / f"{run_id}.mp4"
         logger.info("[VideoRenderer] Rendering → %s", output_path.name)
 
-        cmd = self._build_command(
-            background_path=background_path,
-            music_path=music_path,
-            output_path=output_path,
-            text_config=text_config,
-            ken_burns=ken_burns,
-        )
+        text_png = self._rasterize_text_png(text_config)
+        venc = self._venc
+        while True:
+            cmd = self._build_command(
+                background_path=background_path,
+                music_path=music_path,
+                output_path=output_path,
+                text_config=text_config,
+                ken_burns=ken_burns,
+                text_png=text_png,
+                venc=venc,
+                threads=threads,
+            )
+            logger.debug("[VideoRenderer] FFmpeg command:\n  %s", " ".join(cmd))
+            result = self._run_ffmpeg(cmd, output_path)
+            if result.success or venc is None or not _is_encoder_error(
+                result.error_message, venc
+            ):
+                return result
+            # Encoders can be compiled in without a usable device behind
+            # them; retry this render only, other renders keep trying it
+            logger.warning(
+                "[VideoRenderer] %s encode failed — retrying with %s.",
+                venc,
+                _VIDEO_CODEC,
+            )
+            venc = None
+
+    def render_many(
+        self,
+        jobs: list[dict],
+        max_workers: Optional[int] = None,
+    ) -> list[RenderResult]:
+        """
+        Render several independent videos concurrently.
 
-        logger.debug("[VideoRenderer] FFmpeg command:\n  %s", " ".join(cmd))
-        return self._run_ffmpeg(cmd, output_path)
+        Each job runs :meth:`render` on a worker thread; the encoding
+        happens inside the FFmpeg child processes, so N workers keep N
+        encodes running in parallel while the renderer (and its FFmpeg
+        probes) is built only once.
+
+        Parameters
+        ----------
+        jobs : list[dict]
+            Keyword arguments for :meth:`render`, one dict per video.
+        max_workers : int | None
+            Concurrent renders (default: half the CPU count, at least 1).
+
+        Returns
+        -------
+        list[RenderResult]
+            Results in the same order as *jobs*.
+        """
+        if not jobs:
+            return []
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) // 2)
+        max_workers = min(max_workers, len(jobs))
+
+        logger.info(
+            "[VideoRenderer] Batch rendering %d videos (%d workers)…",
+            len(jobs),
+            max_workers,
+        )
+        # Share the cores between workers instead of oversubscribing them
+        threads = max(1, self._threads // max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda job: self._render_job(threads, **job), jobs))
 
     def render_with_random_ken_burns(
         self,
@@ -328,6 +699,9 @@ class VideoRenderer:
         output_path: Path,
         text_config: TextConfig,
         ken_burns: KenBurnsConfig,
+        text_png: Optional[Path] = None,
+        venc: Optional[str] = None,
+        threads: int = 1,
     ) -> list[str]:
         """
         Construct the complete FFmpeg CLI command.
@@ -339,7 +713,7 @@ class VideoRenderer:
           [0:v]
             scale          → upscale to cover 1080×1920 with headroom
             zoompan        → Ken Burns slow-zoom (outputs 1080×1920 @fps)
-            drawtext       → centred quote text with box backdrop
+            overlay [2:v]  → pre-rasterised quote PNG (or drawtext chain)
             fade (video)   → fade-in at t=0, fade-out near end
           [1:a]
             atrim + afade in/out
@@ -347,11 +721,15 @@ class VideoRenderer:
         **FFmpeg < 4 (legacy fallback)**
           [0:v]
             scale+pad      → fit to 1080×1920, black bars if needed
-            drawtext       → same text overlay
+            overlay        → same text overlay
             fade in/out    → same fades
           [1:a]
             same audio chain
 
+        The video encoder is the probed hardware encoder when there is
+        one, fed NV12 frames (VAAPI additionally uploads them with
+        ``hwupload``), otherwise libx264 at ``_PRESET`` / ``_CRF``.
+
         Parameters
         ----------
         background_path : Path
@@ -359,6 +737,13 @@ class VideoRenderer:
         output_path : Path
         text_config : TextConfig
         ken_burns : KenBurnsConfig
+        text_png : Path | None
+            Quote card from :meth:`_rasterize_text_png`.  When ``None``
+            the text is drawn with ``drawtext`` filters instead.
+        venc : str | None
+            Hardware encoder to use, or ``None`` for libx264.
+        threads : int
+            FFmpeg encoder / filter threads for this render.
 
         Returns
         -------
@@ -366,69 +751,108 @@ class VideoRenderer:
             Fully quoted FFmpeg argument list.
         """
         if self._ffmpeg_major >= 4:
-            vf = self._vf_ken_burns(ken_burns, text_config)
+            bg = self._vf_ken_burns(ken_burns)
         else:
-            vf = self._vf_compat(text_config)
+            bg = self._vf_compat()
+        vfade, af = self._vfade, self._af
 
-        fade_out_start = self.duration_sec - self.fade_sec
-        af = (
-            f"atrim=0:{self.duration_sec},"
-            f"asetpts=PTS-STARTPTS,"
-            f"afade=t=in:st=0:d={self.fade_sec},"
-            f"afade=t=out:st={fade_out_start}:d={self.fade_sec}"
-        )
+        if venc is None:
+            vcodec = [*_X264_ARGS]
+        else:
+            vcodec = ["-c:v", venc, *_ENCODER_FLAGS[venc]]
+            if venc in _HEVC_ENCODERS:
+                # QuickTime / iOS only play HEVC in MP4 tagged hvc1
+                vcodec += ["-tag:v", "hvc1"]
+        vaapi = venc is not None and venc.endswith("_vaapi")
+        # Frames are uploaded as NV12 surfaces for VAAPI, so no -pix_fmt
+        upload = f",format={_HW_PIX_FMT},hwupload" if vaapi else ""
+        if not vaapi:
+            # Hand hardware encoders NV12 directly instead of planar
+            # yuv420p they would repack (h264_qsv rejects it outright).
+            pix_fmt = _PIX_FMT if venc is None else _HW_PIX_FMT
+            vcodec += ["-pix_fmt", pix_fmt]
+
+        if text_png is not None:
+            # The still PNG is a single frame; overlay repeats it, so the
+            # text is rasterised once instead of per frame.
+            centre_y = _even(_HEIGHT * _TEXT_CENTRE)
+            text_inputs = ["-i", str(text_png)]
+            video_args = [
+                "-filter_complex",
+                f"[0:v]{bg}[bg];"
+                f"[bg][2:v]overlay=x=(W-w)/2:y={centre_y}-h/2,{vfade}{upload}[v]",
+                "-map", "[v]",
+                "-map", "1:a",
+            ]
+        else:
+            drawtext = self._build_drawtext_chain(text_config)
+            text_inputs = []
+            video_args = ["-vf", f"{bg},{drawtext},{vfade}{upload}"]
+
+        # zoompan expands one input frame into all d= output frames, so
+        # the image is decoded (and scaled / cropped) once; only the
+        # compat chain needs the demuxer to loop it.
+        loop = [] if self._ffmpeg_major >= 4 else ["-loop", "1"]
 
         cmd = [
             self.ffmpeg_path,
             "-y",
-            "-loop", "1",
+            "-nostats",
+            *(["-vaapi_device", _VAAPI_DEVICE] if vaapi else []),
+            *loop,
             "-i", str(background_path),
             "-i", str(music_path),
-            "-t", str(self.duration_sec),
-            "-vf", vf,
+            *text_inputs,
+            "-t", self._duration_arg,
+            *video_args,
             "-af", af,
-            "-c:v", _VIDEO_CODEC,
-            "-preset", _PRESET,
-            "-crf", str(_CRF),
-            "-c:a", _AUDIO_CODEC,
-            "-b:a", _AUDIO_BITRATE,
-            "-pix_fmt", _PIX_FMT,
-            "-r", str(self.fps),
-            "-shortest",
-            "-movflags", "+faststart",
+            "-threads", str(threads),
+            *vcodec,
+            "-r", self._fps_arg,
+            *_OUTPUT_ARGS,
             str(output_path),
         ]
+        if self._ffmpeg_major >= 4:
+            # Run the zoompan / drawtext chain on every core; these global
+            # options don't exist in the legacy builds the compat path serves
+            cmd[1:1] = [
+                "-filter_threads", str(threads),
+                "-filter_complex_threads", str(threads),
+            ]
         return cmd
 
-    def _vf_ken_burns(self, ken_burns: KenBurnsConfig, text_config: TextConfig) -> str:
+    def _vf_ken_burns(self, ken_burns: KenBurnsConfig) -> str:
         """
-        Build the modern (FFmpeg ≥ 4) video filter chain with Ken Burns
-        zoompan effect and drawtext overlay.
+        Build the modern (FFmpeg ≥ 4) background chain with the Ken Burns
+        zoompan effect.
 
         Parameters
         ----------
         ken_burns : KenBurnsConfig
-        text_config : TextConfig
 
         Returns
         -------
         str
-            FFmpeg -vf expression.
+            Filter chain producing 1080×1920 frames at *fps*.
         """
-        total_frames = self.duration_sec * self.fps
-        fade_out_start = self.duration_sec - self.fade_sec
+        total_frames = self._total_frames
         z_start = ken_burns.zoom_start
         z_end = ken_burns.zoom_end
 
-        zoom_expr = f"'min({z_start}+({z_end}-{z_start})*on/{total_frames},{z_end})'"
+        # zoompan re-evaluates z / x / y for every output frame, so the
+        # per-frame steps are folded into constants here and each
+        # expression is a single multiply-add on the frame index.  ``on``
+        # never reaches total_frames, so the ramp needs no clamp.
+        zoom_step = (z_end - z_start) / total_frames
+        zoom_expr = f"'{z_start}{zoom_step:+.10f}*on'"
 
         x_expr = (
-            f"'(iw-ow)/2+{ken_burns.x_drift_px}*on/{total_frames}'"
+            f"'(iw-ow)/2{ken_burns.x_drift_px / total_frames:+.10f}*on'"
             if ken_burns.x_drift_px != 0
             else "'(iw-ow)/2'"
         )
         y_expr = (
-            f"'(ih-oh)/2+{ken_burns.y_drift_px}*on/{total_frames}'"
+            f"'(ih-oh)/2{ken_burns.y_drift_px / total_frames:+.10f}*on'"
             if ken_burns.y_drift_px != 0
             else "'(ih-oh)/2'"
         )
@@ -438,58 +862,160 @@ class VideoRenderer:
             f":d={total_frames}:s={_WIDTH}x{_HEIGHT}:fps={self.fps}"
         )
 
+        # Cover-scale + crop to 9:16 with zoom headroom (even dimensions
+        # for yuv420p), then convert to the output pixel format.  All of
+        # this runs on the single input frame, not per output frame, so
+        # zoompan, the overlay, the fades and the encoder work in
+        # yuv420p without a per-frame RGB → YUV conversion.
         pad_factor = max(z_end, 1.0) + 0.02
-        scale_w = int(_WIDTH * pad_factor / 2) * 2
-        scale_h = int(_HEIGHT * pad_factor / 2) * 2
+        scale_w = _even(_WIDTH * pad_factor)
+        scale_h = _even(_HEIGHT * pad_factor)
         scale = (
             f"scale={scale_w}:{scale_h}:"
             f"force_original_aspect_ratio=increase,"
-            f"crop={scale_w}:{scale_h}"
-        )
-
-        drawtext_filters = self._build_drawtext_chain(text_config)
-        vfade = (
-            f"fade=t=in:st=0:d={self.fade_sec},"
-            f"fade=t=out:st={fade_out_start}:d={self.fade_sec}"
+            f"crop={scale_w}:{scale_h},"
+            f"format={_PIX_FMT}"
         )
-        return f"{scale},{zoompan},{drawtext_filters},{vfade}"
+        return f"{scale},{zoompan}"
 
-    def _vf_compat(self, text_config: TextConfig) -> str:
+    def _vf_compat(self) -> str:
         """
-        Build a legacy-compatible (FFmpeg 2.x / 3.x) video filter chain.
+        Build a legacy-compatible (FFmpeg 2.x / 3.x) background chain.
 
         Uses simple scale+pad instead of zoompan so it works on any
         FFmpeg version — ideal for the user's installed 2013 build while
         they update to a modern release.
 
-        Parameters
-        ----------
-        text_config : TextConfig
-
         Returns
         -------
         str
-            FFmpeg -vf expression.
+            Filter chain producing 1080×1920 frames.
         """
-        fade_out_start = self.duration_sec - self.fade_sec
-
         # Scale to fill canvas (crop to exact 1080×1920)
-        scale = (
+        return (
             f"scale={_WIDTH}:{_HEIGHT}:force_original_aspect_ratio=increase,"
             f"crop={_WIDTH}:{_HEIGHT}"
         )
 
-        drawtext_filters = self._build_drawtext_chain(text_config)
-        vfade = (
-            f"fade=t=in:st=0:d={self.fade_sec},"
-            f"fade=t=out:st={fade_out_start}:d={self.fade_sec}"
+    def _rasterize_text_png(self, cfg: TextConfig) -> Optional[Path]:
+        """
+        Render the wrapped text, shadow and backdrop box once with Pillow.
+
+        The PNG is cropped to the text block so ``overlay`` only blends
+        that region.  Cards are cached in ``.cache/textcards`` under a
+        hash of *cfg*, so re-rendering a quote (e.g. with other Ken Burns
+        parameters) skips Pillow entirely; only the most recently used
+        ``_TEXT_CACHE_MAX`` cards are kept.
+
+        Parameters
+        ----------
+        cfg : TextConfig
+            Text visual configuration.
+
+        Returns
+        -------
+        Path | None
+            Path to the RGBA PNG, or ``None`` when Pillow is unavailable,
+            the text is empty or rasterisation fails (callers then fall
+            back to :meth:`_build_drawtext_chain`).
+        """
+        key = repr((
+            cfg.text, str(cfg.font_path or ""), cfg.font_size, cfg.font_color,
+            cfg.box, cfg.box_color, cfg.box_border, cfg.line_spacing, cfg.max_chars,
+        ))
+        png_path = self._text_cache_dir / (
+            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png"
         )
-        return f"{scale},{drawtext_filters},{vfade}"
+        try:
+            os.utime(png_path)  # cache hit: mark as recently used
+            return png_path
+        except OSError:
+            pass
+
+        try:
+            from PIL import Image, ImageColor, ImageDraw, ImageFont
+        except ImportError:
+            return None
+
+        lines = [line for line in self._wrap_text(cfg.text, cfg.max_chars) if line]
+        if not lines:
+            return None
+
+        def rgba(expr: str) -> tuple[int, int, int, int]:
+            # FFmpeg colour syntax: name | 0xRRGGBB | #RRGGBB, optional @alpha
+            colour, _, alpha = expr.partition("@")
+            if colour.lower().startswith("0x"):
+                colour = "#" + colour[2:]
+            r, g, b = ImageColor.getrgb(colour)[:3]
+            return r, g, b, round(float(alpha or 1.0) * 255)
+
+        try:
+            font: Any
+            if cfg.font_path and Path(cfg.font_path).exists():
+                font = ImageFont.truetype(str(cfg.font_path), cfg.font_size)
+            else:
+                try:
+                    font = ImageFont.load_default(size=cfg.font_size)
+                except TypeError:   # Pillow < 10.1 has no sized default
+                    font = ImageFont.load_default()
+
+            text = "\n".join(lines)
+            probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+            left, top, right, bottom = probe.multiline_textbbox(
+                (0, 0), text, font=font, spacing=cfg.line_spacing, align="center"
+            )
+            # Default / FreeType fonts may report fractional extents
+            left, top = math.floor(left), math.floor(top)
+            right, bottom = math.ceil(right), math.ceil(bottom)
+            pad = cfg.box_border if cfg.box else 0
+            # Even card size keeps (W-w)/2 and centre-h/2 on the chroma grid
+            width = _even(right - left + 2 * pad + _SHADOW_OFFSET)
+            height = _even(bottom - top + 2 * pad + _SHADOW_OFFSET)
+
+            card = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            if cfg.box:
+                ImageDraw.Draw(card).rectangle(
+                    (0, 0, width - 1, height - 1), fill=rgba(cfg.box_color)
+                )
+            glyphs = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(glyphs)
+            origin = (pad - left, pad - top)
+            for offset, colour in (
+                (_SHADOW_OFFSET, _FONT_SHADOW_COLOR),
+                (0, cfg.font_color),
+            ):
+                draw.multiline_text(
+                    (origin[0] + offset, origin[1] + offset),
+                    text,
+                    font=font,
+                    fill=rgba(colour),
+                    spacing=cfg.line_spacing,
+                    align="center",
+                )
+
+            # Write under a unique name, then rename, so concurrent
+            # render_many workers never read a half-written card
+            self._text_cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = png_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            Image.alpha_composite(card, glyphs).save(tmp_path, format="PNG", compress_level=1)
+            os.replace(tmp_path, png_path)
+            _prune_text_cache(self._text_cache_dir, _TEXT_CACHE_MAX)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "[VideoRenderer] Text rasterisation failed (%s) — using drawtext.", exc
+            )
+            return None
+        return png_path
 
     def _build_drawtext_chain(self, cfg: TextConfig) -> str:
         """
-        Build a chain of FFmpeg ``drawtext`` filter expressions — one per
-        wrapped line — centred vertically and horizontally on the canvas.
+        Build the FFmpeg ``drawtext`` filter(s) for the wrapped text,
+        centred vertically and horizontally on the canvas.
+
+        FFmpeg ≥ 7 gets a single multi-line ``drawtext`` (``text_align``
+        centres each line), so the frame is traversed once instead of
+        once per line.  Older builds lack ``text_align`` and get one
+        ``drawtext`` per line.
 
         Parameters
         ----------
@@ -511,7 +1037,7 @@ class VideoRenderer:
 
         # Vertical start: centre block on the lower-middle of the frame
         # (60 % down) so the top portion stays clean for aesthetic shots
-        centre_y = int(_HEIGHT * 0.60)
+        centre_y = _even(_HEIGHT * _TEXT_CENTRE)
         y_start = centre_y - total_text_h // 2
 
         font_arg = ""
@@ -527,6 +1053,21 @@ class VideoRenderer:
                 f":boxborderw={cfg.box_border}"
             )
 
+        if self._ffmpeg_major >= 7:
+            escaped = "\n".join(self._escape_drawtext(line) for line in lines)
+            return (
+                f"drawtext=text='{escaped}'"
+                f"{font_arg}"
+                f":fontsize={cfg.font_size}"
+                f":fontcolor={cfg.font_color}"
+                f":line_spacing={cfg.line_spacing}"
+                f":text_align=C"
+                f":x=(w-text_w)/2"
+                f":y={centre_y}-text_h/2"
+                f"{box_arg}"
+                f":shadowx=2:shadowy=2:shadowcolor={_FONT_SHADOW_COLOR}"
+            )
+
         filters: list[str] = []
         for i, line in enumerate(lines):
             escaped = self._escape_drawtext(line)
@@ -564,35 +1105,49 @@ class VideoRenderer:
         -------
         RenderResult
         """
+        timeout = self.duration_sec * 15
         try:
-            proc = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.duration_sec * 15,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
-        except subprocess.TimeoutExpired:
-            msg = f"FFmpeg timed out after {self.duration_sec * 15}s"
+        except Exception as exc:  # noqa: BLE001
+            msg = f"FFmpeg subprocess error: {exc}"
             logger.error("[VideoRenderer] %s", msg)
             return RenderResult(
                 output_path=output_path,
                 success=False,
                 error_message=msg,
             )
-        except Exception as exc:  # noqa: BLE001
-            msg = f"FFmpeg subprocess error: {exc}"
+
+        # Drain stderr on a side thread, keeping only the tail that the
+        # error message needs; the rest is dropped line by line.
+        tail: collections.deque[bytes] = collections.deque(maxlen=_STDERR_TAIL_LINES)
+        reader = threading.Thread(target=tail.extend, args=(proc.stderr,), daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            reader.join(timeout=1)
+            msg = f"FFmpeg timed out after {timeout}s"
             logger.error("[VideoRenderer] %s", msg)
             return RenderResult(
                 output_path=output_path,
                 success=False,
                 error_message=msg,
             )
+        reader.join()
+        proc.stderr.close()
 
-        if proc.returncode != 0:
-            stderr_tail = (proc.stderr or "")[-600:]
+        if returncode != 0:
+            stderr_tail = b"".join(tail).decode("utf-8", errors="replace")[-600:]
             logger.error(
                 "[VideoRenderer] FFmpeg exited %d:\n%s",
-                proc.returncode,
+                returncode,
                 stderr_tail,
             )
             return RenderResult(
@@ -639,15 +1194,7 @@ class VideoRenderer:
         list[str]
             List of wrapped line strings.
         """
-        import textwrap
-        lines: list[str] = []
-        for paragraph in text.splitlines():
-            paragraph = paragraph.strip()
-            if not paragraph:
-                continue
-            wrapped = textwrap.wrap(paragraph, width=max_chars)
-            lines.extend(wrapped)
-        return lines or [text.strip()]
+        return list(_wrap_lines(text, max_chars))
 
     @staticmethod
     def _escape_drawtext(text: str) -> str:
@@ -670,57 +1217,3 @@ class VideoRenderer:
         text = text.replace("'", "\\'")
         text = text.replace(":", "\\:")
         return text
-
-    def _verify_ffmpeg(self) -> None:
-        """
-        Confirm the FFmpeg binary is reachable.
-
-        Raises
-        ------
-        EnvironmentError
-            If ``shutil.which`` cannot find the binary.
-        """
-        resolved = shutil.which(self.ffmpeg_path)
-        if resolved is None:
-            raise EnvironmentError(
-                f"FFmpeg not found at '{self.ffmpeg_path}'. "
-                "Install FFmpeg and add it to your system PATH, or pass the "
-                "full path via ffmpeg_path= during construction.\n"
-                "Windows: https://www.gyan.dev/ffmpeg/builds/\n"
-                "macOS:   brew install ffmpeg\n"
-                "Linux:   sudo apt install ffmpeg"
-            )
-        logger.info("[VideoRenderer] FFmpeg found → %s", resolved)
-
-    def _detect_ffmpeg_major(self) -> int:
-        """
-        Parse ``ffmpeg -version`` to extract the major version number.
-
-        Returns
-        -------
-        int
-            Major version (e.g. ``6`` for FFmpeg 6.1.1).
-            Returns ``0`` if detection fails so the compat path is used.
-        """
-        import re
-        try:
-            proc = subprocess.run(
-                [self.ffmpeg_path, "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            # First line looks like: "ffmpeg version 6.1.1 ..."
-            # or legacy:             "ffmpeg version N-55702-g920046a ..."
-            first_line = (proc.stdout or proc.stderr or "").splitlines()[0]
-            m = re.search(r"version\s+(?:N-\d+-\w+|([\d]+))", first_line)
-            if m and m.group(1):
-                major = int(m.group(1))
-                logger.debug("[VideoRenderer] FFmpeg major version: %d", major)
-                return major
-            # Legacy build string like N-55702-g920046a has no numeric version
-            logger.debug("[VideoRenderer] FFmpeg version string '%s' — treating as legacy (< 4).", first_line.strip())
-            return 0
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("[VideoRenderer] Could not detect FFmpeg version: %s — using compat mode.", exc)
-            return 0
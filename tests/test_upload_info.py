@@ -0,0 +1,60 @@
+"""
+tests/test_upload_info.py
+─────────────────────────
+Step 5 must only log upload info for videos that were actually rendered.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import main
+from core.GeminiEngine import GeneratedContent
+from core.VideoRenderer import RenderResult
+
+
+class StepLogUploadInfoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_path = Path(tmp.name) / "upload_info.csv"
+        csv_logger = main._CsvLogger(self.csv_path, main.CSV_FIELDNAMES)
+        self.addCleanup(csv_logger.close)
+        patcher = mock.patch.object(main, "_UPLOAD_CSV_LOGGER", csv_logger)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.csv_logger = csv_logger
+        self.content = GeneratedContent(
+            '"A quote"', "A title", "Caption\n\n#a #b", "theme", "mood"
+        )
+
+    def _render_result(self, success: bool) -> RenderResult:
+        return RenderResult(
+            output_path=Path("output") / "run1.mp4",
+            duration_sec=30,
+            width=1080,
+            height=1920,
+            success=success,
+        )
+
+    def test_no_row_when_render_result_is_none(self) -> None:
+        main.step_log_upload_info("run1", self.content, None)
+        self.csv_logger.close()
+        self.assertFalse(self.csv_path.exists())
+
+    def test_no_row_when_render_failed(self) -> None:
+        main.step_log_upload_info("run1", self.content, self._render_result(False))
+        self.csv_logger.close()
+        self.assertFalse(self.csv_path.exists())
+
+    def test_row_written_for_successful_render(self) -> None:
+        main.step_log_upload_info("run1", self.content, self._render_result(True))
+        self.csv_logger.close()
+        lines = self.csv_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith("run1.mp4,A title,Caption,A quote,"))
+
+
+if __name__ == "__main__":
+    unittest.main()
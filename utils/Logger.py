@@ -5,18 +5,25 @@ Lightweight CSV run-logger for MoodLoop AI.
 
 Appends one row per pipeline run to a persistent CSV file.
 Creates the file (with a header) automatically on first write.
-Thread-safe via a threading.Lock so multiple workers can safely
-share a single Logger instance.
+Rows are handed to a background writer thread through a lock-free
+``queue.SimpleQueue`` and written in batches (by count or age, and at interpreter exit), so
+callers never wait on disk I/O.  Multiple workers can safely share a
+single Logger instance.
 """
 
 from __future__ import annotations
 
+import atexit
 import csv
+import functools
 import logging
+import os
+import queue
 import threading
-from datetime import datetime
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Iterable, Optional
 
 log = logging.getLogger(__name__)
 
@@ -39,13 +46,67 @@ DEFAULT_FIELDS: list[str] = [
     "error_message",
 ]
 
+_MAX_BUFFER_ROWS: int = 32        # rows held before a flush
+_MAX_BUFFER_AGE_SEC: float = 5.0  # oldest buffered row age before a flush
+_FILE_BUFFER_BYTES: int = 64 * 1024
+_SYNC_EVERY_ROWS: int = 50        # written rows between fsync() calls …
+_SYNC_EVERY_SEC: float = 5.0      # … or seconds since the last one
+_SCAN_CHUNK_BYTES: int = 1 << 20  # read size when counting existing rows
+_FLUSH_POLL_SEC: float = 0.5      # flush() checks the writer is alive this often
+_MAX_RETRY_ROWS: int = 10_000     # unwritten rows kept for the next attempt
+
+# Stops the writer thread; flush requests are queued as (Event, sync) pairs
+_STOP = object()
+
+
+@dataclass(slots=True)
+class RunRecord:
+    """
+    One pipeline run, for :meth:`RunLogger.log_record`.
+
+    Attributes mirror :data:`DEFAULT_FIELDS`; values are written with
+    ``str()``.  An empty ``timestamp`` is written as the current time
+    (the record itself is left unchanged).
+    """
+
+    run_id: str = ""
+    timestamp: str = ""
+    theme_name: str = ""
+    mood: str = ""
+    quote: str = ""
+    title: str = ""
+    caption: str = ""
+    background_file: str = ""
+    music_file: str = ""
+    video_output: str = ""
+    model: str = ""
+    trending_topics: str = ""
+    render_success: Any = ""
+    error_message: str = ""
+
+
+@functools.lru_cache(maxsize=1)
+def _format_second(epoch_sec: int) -> str:
+    """
+    Format *epoch_sec* as local ``YYYY-MM-DDTHH:MM:SS``.
+
+    Rows logged in a burst share a second, so the single cached entry
+    is reused until the clock ticks over.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(epoch_sec))
+
 
 class RunLogger:
     """
     Append-only CSV logger for pipeline run metadata.
 
-    Each call to :meth:`log_run` writes exactly one row to the CSV.
-    On first write the file is created and the header row is inserted.
+    Each call to :meth:`log_run` queues exactly one row for a background
+    writer thread, which writes queued rows together once
+    *max_buffer_rows* are pending or the oldest is *max_buffer_age_sec*
+    old, on :meth:`flush`, and at interpreter exit.  The file is opened
+    once, on the first write, and kept open until :meth:`close`; if it
+    is empty at that point the header row is inserted.  Usable as a
+    context manager.
 
     Parameters
     ----------
@@ -55,6 +116,10 @@ class RunLogger:
         Column names.  Defaults to :data:`DEFAULT_FIELDS` when ``None``.
     encoding : str
         File encoding (default: ``"utf-8"``).
+    max_buffer_rows : int
+        Pending rows that trigger a write (``1`` writes every row at once).
+    max_buffer_age_sec : float
+        Age of the oldest pending row that triggers a write.
 
     Examples
     --------
@@ -67,23 +132,52 @@ class RunLogger:
         csv_path: Path,
         fields: Optional[list[str]] = None,
         encoding: str = "utf-8",
+        max_buffer_rows: int = _MAX_BUFFER_ROWS,
+        max_buffer_age_sec: float = _MAX_BUFFER_AGE_SEC,
     ) -> None:
         self.csv_path = Path(csv_path)
         self.fields: list[str] = fields if fields is not None else list(DEFAULT_FIELDS)
+        self._fields_tuple: tuple[str, ...] = tuple(self.fields)
         self.encoding = encoding
-        self._lock = threading.Lock()
+        self._max_buffer_rows = max(1, max_buffer_rows)
+        self._max_buffer_age_sec = max_buffer_age_sec
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        # The handle / writer are only touched by the writer thread (and
+        # by close() once that thread has exited)
+        self._fh: Optional[IO[str]] = None
+        self._writer: Any = None
+        self._unsynced_rows = 0
+        self._last_sync = time.monotonic()
+        # First write failure since the last flush(); raised from there
+        self._write_error: Optional[BaseException] = None
+        # Rows a failed write left behind, retried (in order) before the
+        # next batch; beyond _MAX_RETRY_ROWS the oldest are dropped
+        self._retry_rows: list[list[str]] = []
+        self._dropped_rows = 0
+        self._lock = threading.Lock()   # guards writer-thread start / stop
+        self._error_lock = threading.Lock()   # guards _write_error (close() joins under _lock)
 
         # Create parent directories if they don't exist
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        # Rows on disk: the existing file is scanned lazily, on the first
+        # write or query, then the writer thread adds each written batch
+        self._run_id_index: Optional[int] = (
+            self._fields_tuple.index("run_id") if "run_id" in self._fields_tuple else None
+        )
+        self._row_count = 0
+        self._last_run_id: Optional[str] = None
+        self._scanned = False
+        self._count_lock = threading.Lock()   # guards the scan vs. batch counting
         log.debug("RunLogger initialised → %s", self.csv_path)
 
     # ------------------------------------------------------------------ #
     #  Public API                                                          #
     # ------------------------------------------------------------------ #
 
-    def log_run(self, **kwargs: Any) -> None:
+    def log_run(self, *, force: bool = False, **kwargs: Any) -> None:
         """
-        Append a single row to the CSV log.
+        Queue a single row for the CSV log.
 
         Any keyword argument whose name appears in :attr:`fields` is
         written to the corresponding column.  Unrecognised keys are
@@ -94,6 +188,9 @@ class RunLogger:
 
         Parameters
         ----------
+        force : bool
+            Wait until this row (and any pending ones) is written and
+            fsync'ed to disk.
         **kwargs
             Arbitrary run metadata.  Common keys:
 
@@ -111,42 +208,165 @@ class RunLogger:
             - ``render_success`` – ``"true"`` / ``"false"``
             - ``error_message``  – failure details when applicable
 
+        Write failures happen on the writer thread: they are logged, the
+        affected rows are kept and retried with the next write, flush or
+        close, and the error is raised from the next :meth:`flush` (so
+        from here too when *force* is set).
+
         Raises
         ------
-        OSError
-            If the CSV file cannot be opened for writing.
+        RuntimeError
+            With *force*, if a write failed since the last flush.
+        """
+        self._enqueue([self._row_from_kwargs(kwargs)], force)
+
+    def log_run_many(self, rows: Iterable[dict[str, Any]], *, force: bool = False) -> int:
         """
+        Queue many rows at once, e.g. when replaying or importing runs.
+
+        Each dict is handled like :meth:`log_run` kwargs.  The writer
+        thread is checked once for the whole batch rather than per row.
+
+        Parameters
+        ----------
+        rows : Iterable[dict[str, Any]]
+            Run metadata, one dict per row.
+        force : bool
+            Same as for :meth:`log_run`.
+
+        Returns
+        -------
+        int
+            Number of rows queued.
+        """
+        batch = [self._row_from_kwargs(dict(data)) for data in rows]
+        self._enqueue(batch, force)
+        return len(batch)
+
+    def log_record(self, record: RunRecord, *, force: bool = False) -> None:
+        """
+        Queue *record* for the CSV log.
+
+        The fast path for callers that build a :class:`RunRecord` once:
+        columns are read as slot attributes instead of looked up in a
+        kwargs dict.  Columns of a custom :attr:`fields` list that the
+        record lacks are written as empty strings.
+
+        Parameters
+        ----------
+        record : RunRecord
+            Run metadata.
+        force : bool
+            Same as for :meth:`log_run`.
+        """
+        timestamp = record.timestamp or _format_second(int(time.time()))
+        row = [
+            timestamp if field == "timestamp" else str(getattr(record, field, ""))
+            for field in self._fields_tuple
+        ]
+        self._enqueue([row], force)
+
+    def _row_from_kwargs(self, kwargs: dict[str, Any]) -> list[str]:
+        """Align *kwargs* to :attr:`fields`, filling in ``timestamp``."""
         # Ensure timestamp is always set
         if "timestamp" not in kwargs:
-            kwargs["timestamp"] = datetime.now().isoformat(timespec="seconds")
+            kwargs["timestamp"] = _format_second(int(time.time()))
+        # Unknown keys silently dropped
+        return [str(kwargs.get(field, "")) for field in self._fields_tuple]
+
+    def _enqueue(self, rows: list[list[str]], force: bool) -> None:
+        """Hand *rows* to the writer thread, starting it if needed."""
+        if not rows:
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._drain, name="RunLogger-writer", daemon=True
+                )
+                self._thread.start()
+                # Only a running writer needs the exit hook; close() drops it
+                atexit.unregister(self.close)
+                atexit.register(self.close)
+        for row in rows:
+            self._queue.put(row)
+        if force:
+            self.flush(sync=True)
+
+    def flush(self, sync: bool = False) -> None:
+        """
+        Block until every row queued so far has been written to the CSV.
+
+        Written rows otherwise reach the disk in batches: the writer
+        thread calls ``fsync`` every ``_SYNC_EVERY_ROWS`` rows or
+        ``_SYNC_EVERY_SEC`` seconds.
+
+        Parameters
+        ----------
+        sync : bool
+            Also ``fsync`` the file, e.g. at the end of a pipeline run.
 
-        # Build row dict aligned to self.fields; unknown keys silently dropped
-        row: dict[str, str] = {
-            field: str(kwargs.get(field, "")) for field in self.fields
-        }
+        Raises
+        ------
+        RuntimeError
+            If a write failed since the last flush (the message gives the
+            rows still awaiting a retry and any dropped, and the first
+            error, typically ``OSError``, is chained as ``__cause__``), or
+            if the writer thread died before completing the flush.
+        """
+        done = threading.Event()
+        with self._lock:
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                self._queue.put((done, sync))
+            else:
+                done.set()
+        while not done.wait(_FLUSH_POLL_SEC):
+            if not thread.is_alive():
+                break
+        self._raise_write_error()
+        if not done.is_set():
+            raise RuntimeError("RunLogger: writer thread exited before flushing")
+
+    def _raise_write_error(self) -> None:
+        """Raise (and clear) the error stored by the writer thread, if any."""
+        with self._error_lock:
+            exc, self._write_error = self._write_error, None
+            dropped, self._dropped_rows = self._dropped_rows, 0
+            pending = len(self._retry_rows)
+        if exc is not None:
+            raise RuntimeError(
+                f"RunLogger: write to {self.csv_path} failed ({exc}); "
+                f"{pending} row(s) awaiting retry, {dropped} dropped"
+            ) from exc
 
+    def close(self) -> None:
+        """
+        Write pending rows, stop the writer thread and close the file.
+
+        The next :meth:`log_run` restarts the thread and reopens the file.
+        """
+        atexit.unregister(self.close)
         with self._lock:
-            write_header = not self.csv_path.exists() or self.csv_path.stat().st_size == 0
-            try:
-                with self.csv_path.open("a", newline="", encoding=self.encoding) as fh:
-                    writer = csv.DictWriter(
-                        fh,
-                        fieldnames=self.fields,
-                        extrasaction="ignore",
-                        quoting=csv.QUOTE_ALL,
-                    )
-                    if write_header:
-                        writer.writeheader()
-                        log.debug("RunLogger: created CSV with header → %s", self.csv_path)
-                    writer.writerow(row)
-                    log.info(
-                        "RunLogger: row written (run_id=%s) → %s",
-                        kwargs.get("run_id", "?"),
-                        self.csv_path,
-                    )
-            except OSError as exc:
-                log.error("RunLogger: failed to write CSV row: %s", exc)
-                raise
+            if self._thread is not None and self._thread.is_alive():
+                self._queue.put(_STOP)
+                self._thread.join()
+            self._thread = None
+            if self._retry_rows:
+                log.error(
+                    "RunLogger: %d row(s) still unwritten at close; the next "
+                    "log call retries them", len(self._retry_rows),
+                )
+            if self._fh is not None:
+                self._sync(force=True)
+                self._fh.close()
+                self._fh = None
+                self._writer = None
+
+    def __enter__(self) -> "RunLogger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def log_run_from_dict(self, data: dict[str, Any]) -> None:
         """
@@ -159,6 +379,147 @@ class RunLogger:
         """
         self.log_run(**data)
 
+    # ------------------------------------------------------------------ #
+    #  Writer thread                                                       #
+    # ------------------------------------------------------------------ #
+
+    def _drain(self) -> None:
+        """
+        Writer-thread loop: collect queued rows into batches and write them.
+
+        A batch is written when it holds *max_buffer_rows* rows, when its
+        oldest row is *max_buffer_age_sec* old, or when a flush / stop
+        request arrives.
+        """
+        try:
+            self._drain_loop()
+        except Exception as exc:  # noqa: BLE001
+            log.exception("RunLogger: writer thread failed")
+            self._store_error(exc)
+        finally:
+            # Keep queued rows for the next writer thread, and wake anyone
+            # waiting on a flush that will now never be handled
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, list):
+                    self._keep_for_retry([item])
+                elif isinstance(item, tuple):
+                    item[0].set()
+
+    def _drain_loop(self) -> None:
+        """Body of :meth:`_drain`; returns on a stop request."""
+        while True:
+            item = self._queue.get()
+            batch: list[list[str]] = []
+            deadline = time.monotonic() + self._max_buffer_age_sec
+            while isinstance(item, list):
+                batch.append(item)
+                if len(batch) >= self._max_buffer_rows:
+                    item = None
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    item = None
+                    break
+
+            if batch or self._retry_rows:
+                self._write_batch(batch)
+            if isinstance(item, tuple):
+                done, sync = item
+                if sync:
+                    self._sync(force=True)
+                done.set()
+            elif item is _STOP:
+                return
+
+    def _write_batch(self, batch: list[list[str]]) -> None:
+        """
+        Append earlier unwritten rows plus *batch* to the CSV, opening it
+        (and adding the header) if needed.  On failure the rows are kept
+        for the next attempt.
+        """
+        rows, self._retry_rows = self._retry_rows + batch, []
+        with self._count_lock:
+            # Count pre-existing rows before this batch lands in the file
+            self._ensure_scanned()
+            written = self._write_rows(rows)
+            if written:
+                self._row_count += len(rows)
+                if self._run_id_index is not None:
+                    self._last_run_id = rows[-1][self._run_id_index]
+        if written:
+            self._sync(force=False)
+        else:
+            self._keep_for_retry(rows)
+
+    def _keep_for_retry(self, rows: list[list[str]]) -> None:
+        """Queue *rows* for the next write, dropping (and counting) the oldest past the cap."""
+        self._retry_rows.extend(rows)
+        excess = len(self._retry_rows) - _MAX_RETRY_ROWS
+        if excess > 0:
+            del self._retry_rows[:excess]
+            with self._error_lock:
+                self._dropped_rows += excess
+            log.error("RunLogger: dropped %d unwritten row(s) over the retry cap", excess)
+
+    def _write_rows(self, batch: list[list[str]]) -> bool:
+        """Body of :meth:`_write_batch`; returns ``False`` if the write failed."""
+        try:
+            if self._fh is None:
+                self._fh = self.csv_path.open(
+                    "a", newline="", encoding=self.encoding, buffering=_FILE_BUFFER_BYTES
+                )
+                self._writer = csv.writer(self._fh)
+                if self._fh.tell() == 0:
+                    self._writer.writerow(self._fields_tuple)
+                    log.debug("RunLogger: created CSV with header → %s", self.csv_path)
+            self._writer.writerows(batch)
+            self._fh.flush()
+        except Exception as exc:  # noqa: BLE001
+            log.error("RunLogger: failed to write %d CSV row(s): %s", len(batch), exc)
+            self._store_error(exc)
+            # Drop the handle (and whatever part of the batch it buffered)
+            # so the retry starts from a clean reopen
+            if self._fh is not None:
+                try:
+                    self._fh.close()
+                except Exception:  # noqa: BLE001
+                    pass
+                self._fh = None
+                self._writer = None
+            return False
+        log.info("RunLogger: %d row(s) written → %s", len(batch), self.csv_path)
+        self._unsynced_rows += len(batch)
+        return True
+
+    def _store_error(self, exc: BaseException) -> None:
+        """Keep the first write error for :meth:`flush` to raise."""
+        with self._error_lock:
+            if self._write_error is None:
+                self._write_error = exc
+
+    def _sync(self, force: bool) -> None:
+        """``fsync`` written rows once a threshold is reached (or *force*)."""
+        if self._fh is None or not self._unsynced_rows:
+            return
+        if not (
+            force
+            or self._unsynced_rows >= _SYNC_EVERY_ROWS
+            or time.monotonic() - self._last_sync >= _SYNC_EVERY_SEC
+        ):
+            return
+        try:
+            os.fsync(self._fh.fileno())
+        except OSError as exc:
+            log.error("RunLogger: fsync failed: %s", exc)
+            return
+        self._unsynced_rows = 0
+        self._last_sync = time.monotonic()
+
     # ------------------------------------------------------------------ #
     #  Introspection helpers                                               #
     # ------------------------------------------------------------------ #
@@ -167,33 +528,100 @@ class RunLogger:
         """
         Return the number of data rows currently in the CSV (excludes header).
 
+        The file is scanned once, on the first write or query; after
+        that the count is kept up to date by the writer thread, so this
+        is O(1) once pending rows are flushed.  Rows appended by other
+        processes in the meantime are not seen.  An unreadable file
+        counts as empty.
+
         Returns
         -------
         int
             Number of logged runs; ``0`` if the file does not yet exist.
         """
-        if not self.csv_path.exists():
-            return 0
-        with self._lock, self.csv_path.open(encoding=self.encoding) as fh:
-            return max(0, sum(1 for _ in fh) - 1)   # subtract header line
+        self.flush()
+        with self._count_lock:
+            self._ensure_scanned()
+            return self._row_count
 
     def last_run_id(self) -> Optional[str]:
         """
         Return the ``run_id`` of the most recently logged run.
 
+        Like :meth:`row_count` this is tracked in memory after the initial
+        scan rather than re-parsed from the CSV.
+
         Returns
         -------
         str | None
             Last ``run_id`` value, or ``None`` if the log is empty.
         """
+        self.flush()
+        with self._count_lock:
+            self._ensure_scanned()
+            return self._last_run_id
+
+    def _ensure_scanned(self) -> None:
+        """
+        Seed the row count / last ``run_id`` from the file, once.
+
+        Callers hold ``_count_lock``.  A missing file means no rows; an
+        unreadable one (e.g. *csv_path* is a directory) is logged and
+        treated the same way, and the error resurfaces on write.
+        """
+        if self._scanned:
+            return
+        self._scanned = True
+        try:
+            self._row_count, self._last_run_id = self._scan_existing()
+        except (OSError, ValueError, csv.Error) as exc:
+            log.warning("RunLogger: could not scan %s: %s", self.csv_path, exc)
+            self._row_count, self._last_run_id = 0, None
+
+    def _scan_existing(self) -> tuple[int, Optional[str]]:
+        """
+        Read the existing file once.
+
+        Files without any ``"`` cannot hold multi-line fields, so their
+        rows are counted with C-level ``bytes.count`` over 1 MiB chunks
+        and only the last line is parsed.  Anything else goes through
+        :class:`csv.DictReader`.
+
+        Returns
+        -------
+        tuple[int, str | None]
+            Number of data rows (CSV records, not lines) and the last
+            row's ``run_id`` (``None`` when there is none).
+        """
         if not self.csv_path.exists():
-            return None
-        with self._lock, self.csv_path.open(encoding=self.encoding) as fh:
+            return 0, None
+        with self.csv_path.open("rb") as raw:
+            header = raw.readline()
+            newlines = 0
+            tail = b""   # last (possibly unterminated) line seen so far
+            for chunk in iter(functools.partial(raw.read, _SCAN_CHUNK_BYTES), b""):
+                if b'"' in chunk:
+                    break
+                newlines += chunk.count(b"\n")
+                buf = tail + chunk
+                cut = buf.rfind(b"\n", 0, len(buf) - 1)
+                tail = buf[cut + 1:]
+            else:
+                if b'"' not in header:
+                    count = newlines + (bool(tail) and not tail.endswith(b"\n"))
+                    columns = header.decode(self.encoding).rstrip("\r\n").split(",")
+                    values = tail.decode(self.encoding).rstrip("\r\n").split(",")
+                    idx = columns.index("run_id") if "run_id" in columns else len(values)
+                    return count, (values[idx] if count and idx < len(values) else None)
+
+        with self.csv_path.open(newline="", encoding=self.encoding) as fh:
             reader = csv.DictReader(fh)
+            count = 0
             last: Optional[str] = None
             for row in reader:
+                count += 1
                 last = row.get("run_id")
-            return last
+            return count, last
 
     def __repr__(self) -> str:
         return f"RunLogger(csv_path={self.csv_path!r}, fields={self.fields!r})"